@@ -5,10 +5,12 @@
 """Command-line interface for nunalleq-synth."""
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Sequence
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Sequence
 
 from nunalleq_synth import __version__
 from nunalleq_synth.pipeline.config import GenerationConfig, load_config
@@ -16,14 +18,34 @@ from nunalleq_synth.pipeline.generator import SyntheticGenerator
 from nunalleq_synth.utils.logger import setup_logger
 
 
-def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    """Parse command-line arguments.
+# Defaults for main_fast(), matching the argparse defaults below
+_FAST_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "generate": {
+        "config": None,
+        "num_images": 1000,
+        "resolution": [1920, 1080],
+        "workers": 1,
+        "seed": None,
+        "verbose": False,
+    },
+    "batch": {
+        "config": None,
+        "workers": 4,
+    },
+    "validate": {
+        "visualize": False,
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+    
+    The parser is built once per process and reused by parse_args().
     
-    Args:
-        args: Command-line arguments to parse. If None, uses sys.argv.
-        
     Returns:
-        Parsed arguments namespace.
+        Argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Nunalleq Synthetic Data Generator",
@@ -138,7 +160,19 @@ def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="Generate visualization of annotations",
     )
     
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+    
+    Args:
+        args: Command-line arguments to parse. If None, uses sys.argv.
+        
+    Returns:
+        Parsed arguments namespace.
+    """
+    return _build_parser().parse_args(args)
 
 
 def generate_command(args: argparse.Namespace) -> int:
@@ -164,6 +198,7 @@ def generate_command(args: argparse.Namespace) -> int:
         config.output_dir = args.output
         config.num_images = args.num_images
         config.resolution = tuple(args.resolution)
+        config.num_workers = args.workers
         
         if args.seed is not None:
             config.random_seed = args.seed
@@ -212,6 +247,41 @@ def validate_command(args: argparse.Namespace) -> int:
     return 1
 
 
+_COMMANDS: Dict[str, Callable[[Any], int]] = {
+    "generate": generate_command,
+    "batch": batch_command,
+    "validate": validate_command,
+}
+
+
+def main_fast(command: str, kwargs: Dict[str, Any]) -> int:
+    """Run a command without going through argparse.
+    
+    Intended for worker processes that already have their arguments as
+    Python values. Missing arguments take the command-line defaults.
+    
+    Args:
+        command: Command name ("generate", "batch" or "validate").
+        kwargs: Command arguments keyed by argparse destination name
+            (e.g. ``models``, ``output``, ``num_images``).
+        
+    Returns:
+        Exit code (0 for success, non-zero for error).
+        
+    Raises:
+        ValueError: If the command is unknown.
+    """
+    if command not in _COMMANDS:
+        raise ValueError(f"Unknown command: {command}")
+    
+    args = SimpleNamespace(command=command, **{**_FAST_DEFAULTS[command], **kwargs})
+    
+    log_level = logging.DEBUG if getattr(args, "verbose", False) else logging.INFO
+    setup_logger(log_level)
+    
+    return _COMMANDS[command](args)
+
+
 def main(args: Optional[Sequence[str]] = None) -> int:
     """Main entry point for CLI.
     
@@ -228,15 +298,12 @@ def main(args: Optional[Sequence[str]] = None) -> int:
     setup_logger(log_level)
     
     # Execute command
-    if parsed_args.command == "generate":
-        return generate_command(parsed_args)
-    elif parsed_args.command == "batch":
-        return batch_command(parsed_args)
-    elif parsed_args.command == "validate":
-        return validate_command(parsed_args)
-    else:
+    command = _COMMANDS.get(parsed_args.command)
+    if command is None:
         print("No command specified. Use --help for usage information.")
         return 1
+    
+    return command(parsed_args)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,18 @@
 # ============================================================================
 """Annotation generation and format conversion."""
 
-from nunalleq_synth.annotation.bbox import BoundingBoxCalculator, BoundingBox
+from nunalleq_synth.annotation.bbox import (
+    BoundingBoxCalculator,
+    BoundingBox,
+    BoundingBoxArray,
+)
 from nunalleq_synth.annotation.yolo import YOLOAnnotator
 from nunalleq_synth.annotation.validation import AnnotationValidator
 
 __all__ = [
     "BoundingBoxCalculator",
     "BoundingBox",
+    "BoundingBoxArray",
     "YOLOAnnotator",
     "AnnotationValidator",
 ]
@@ -5,10 +5,18 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    OrderedDict,
+    Sequence,
+    Tuple,
+)
 
 import bpy
-import bpy_extras.object_utils  # FIXED: Added missing import
 import numpy as np
 
 from nunalleq_synth.core.camera import Camera
@@ -42,95 +50,474 @@ class BoundingBox:
     area: int
 
 
+# Column layout of BoundingBoxArray
+_INT_FIELDS = ("x_min", "y_min", "x_max", "y_max", "area", "class_id")
+_FLOAT_FIELDS = ("x_center", "y_center", "width", "height")
+
+
+def _int_column(index: int) -> property:
+    """Create a property returning a view of an integer column."""
+    return property(lambda self: self._ints[index, :self._size])
+
+
+def _float_column(index: int) -> property:
+    """Create a property returning a view of a float column."""
+    return property(lambda self: self._floats[index, :self._size])
+
+
+class BoundingBoxArray:
+    """Columnar (structure-of-arrays) collection of bounding boxes.
+    
+    Stores the BoundingBox fields plus a class id as packed NumPy columns,
+    so validation and export can work on whole columns at once. Columns
+    are exposed as views of length ``len(self)``; storage grows by
+    doubling as boxes are appended.
+    
+    Attributes:
+        x_min, y_min, x_max, y_max: Pixel extents (int32).
+        x_center, y_center, width, height: Normalized geometry (float64).
+        area: Area in pixels (int32).
+        class_id: Class ID per box (int32).
+    """
+    
+    x_min = _int_column(0)
+    y_min = _int_column(1)
+    x_max = _int_column(2)
+    y_max = _int_column(3)
+    area = _int_column(4)
+    class_id = _int_column(5)
+    x_center = _float_column(0)
+    y_center = _float_column(1)
+    width = _float_column(2)
+    height = _float_column(3)
+    
+    def __init__(self, capacity: int = 16) -> None:
+        """Initialize an empty array.
+        
+        Args:
+            capacity: Initial number of boxes to allocate storage for.
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._ints = np.empty((len(_INT_FIELDS), capacity), dtype=np.int32)
+        self._floats = np.empty((len(_FLOAT_FIELDS), capacity), dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _reserve(self, capacity: int) -> None:
+        """Grow storage to hold at least ``capacity`` boxes."""
+        if capacity <= self._ints.shape[1]:
+            return
+        
+        capacity = max(capacity, 2 * self._ints.shape[1])
+        ints = np.empty((len(_INT_FIELDS), capacity), dtype=np.int32)
+        floats = np.empty((len(_FLOAT_FIELDS), capacity), dtype=np.float64)
+        ints[:, :self._size] = self._ints[:, :self._size]
+        floats[:, :self._size] = self._floats[:, :self._size]
+        self._ints = ints
+        self._floats = floats
+    
+    def append(self, bbox: BoundingBox, class_id: int = 0) -> None:
+        """Append a bounding box.
+        
+        Args:
+            bbox: Bounding box to append.
+            class_id: Class ID of the box.
+        """
+        self._reserve(self._size + 1)
+        i = self._size
+        self._ints[:, i] = (
+            bbox.x_min, bbox.y_min, bbox.x_max, bbox.y_max, bbox.area, class_id
+        )
+        self._floats[:, i] = (bbox.x_center, bbox.y_center, bbox.width, bbox.height)
+        self._size += 1
+    
+    def select(self, mask: np.ndarray) -> "BoundingBoxArray":
+        """Get a new array with the boxes where ``mask`` is True.
+        
+        Args:
+            mask: Boolean mask of length ``len(self)``.
+            
+        Returns:
+            Filtered copy.
+        """
+        ints = self._ints[:, :self._size][:, mask]
+        floats = self._floats[:, :self._size][:, mask]
+        
+        result = BoundingBoxArray(ints.shape[1])
+        result._ints[:, :ints.shape[1]] = ints
+        result._floats[:, :floats.shape[1]] = floats
+        result._size = ints.shape[1]
+        return result
+    
+    def to_records(self) -> Iterator[Tuple[int, BoundingBox]]:
+        """Iterate over the boxes as (class_id, BoundingBox) pairs.
+        
+        Yields:
+            (class_id, bbox) tuples in insertion order.
+        """
+        ints = self._ints[:, :self._size].T.tolist()
+        floats = self._floats[:, :self._size].T.tolist()
+        
+        for (x_min, y_min, x_max, y_max, area, class_id), (
+            x_center, y_center, width, height
+        ) in zip(ints, floats):
+            yield class_id, BoundingBox(
+                x_min=x_min,
+                y_min=y_min,
+                x_max=x_max,
+                y_max=y_max,
+                x_center=x_center,
+                y_center=y_center,
+                width=width,
+                height=height,
+                area=area,
+            )
+    
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Tuple[int, BoundingBox]],
+    ) -> "BoundingBoxArray":
+        """Build an array from (class_id, BoundingBox) pairs.
+        
+        Args:
+            records: (class_id, bbox) tuples.
+            
+        Returns:
+            New bounding box array.
+        """
+        records = list(records)
+        result = cls(len(records))
+        for class_id, bbox in records:
+            result.append(bbox, class_id)
+        return result
+
+
+def _project_and_bbox(
+    clip: np.ndarray,
+    width: int,
+    height: int,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Reduce viewport-space vertices to a clamped pixel bounding box.
+    
+    Args:
+        clip: Homogeneous vertices of shape (N, 4) after the combined
+            projection and viewport transform.
+        width: Image width in pixels.
+        height: Image height in pixels.
+        
+    Returns:
+        (x_min, y_min, x_max, y_max) in pixels, or None if no vertex is in
+        front of the camera.
+    """
+    # Drop vertices behind the camera
+    clip = clip[clip[:, 3] > 0]
+    if len(clip) == 0:
+        return None
+    
+    # Perspective divide gives pixels directly; only map the extremes
+    pixels = clip[:, :2] / clip[:, 3:4]
+    p_min = pixels.min(axis=0)
+    p_max = pixels.max(axis=0)
+    
+    x_min = max(0, int(p_min[0]))
+    x_max = min(width, int(p_max[0]))
+    y_min = max(0, int(p_min[1]))
+    y_max = min(height, int(p_max[1]))
+    
+    return x_min, y_min, x_max, y_max
+
+
+def _make_bbox(
+    extent: Tuple[int, int, int, int],
+    width: int,
+    height: int,
+) -> Optional[BoundingBox]:
+    """Build a BoundingBox from clamped pixel extents.
+    
+    Args:
+        extent: (x_min, y_min, x_max, y_max) in pixels.
+        width: Image width in pixels.
+        height: Image height in pixels.
+        
+    Returns:
+        BoundingBox or None if the box has no area.
+    """
+    x_min, y_min, x_max, y_max = extent
+    
+    # Check if bbox has valid area
+    bbox_width = x_max - x_min
+    bbox_height = y_max - y_min
+    
+    if bbox_width <= 0 or bbox_height <= 0:
+        return None
+    
+    # Calculate normalized coordinates
+    x_center = (x_min + x_max) / 2 / width
+    y_center = (y_min + y_max) / 2 / height
+    width_norm = bbox_width / width
+    height_norm = bbox_height / height
+    area = bbox_width * bbox_height
+    
+    return BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_max,
+        y_max=y_max,
+        x_center=x_center,
+        y_center=y_center,
+        width=width_norm,
+        height=height_norm,
+        area=area,
+    )
+
+
 class BoundingBoxCalculator:
-    """Calculates 2D bounding boxes from 3D objects."""
+    """Calculates 2D bounding boxes from 3D objects.
+    
+    Homogeneous local-space vertex arrays are cached per mesh, since only
+    ``matrix_world`` changes between camera viewpoints. Meshes are keyed
+    by ``session_uid``, which unlike the name is never reused for another
+    mesh in the same Blender session.
+    
+    Attributes:
+        cache_size: Maximum number of meshes kept in the vertex cache.
+    """
     
-    def __init__(self) -> None:
-        """Initialize bounding box calculator."""
+    def __init__(self, cache_size: int = 64) -> None:
+        """Initialize bounding box calculator.
+        
+        Args:
+            cache_size: Maximum number of meshes kept in the vertex cache.
+        """
+        self.cache_size = cache_size
+        self._vertex_cache: OrderedDict[Tuple[int, int], np.ndarray] = OrderedDict()
+        
+        # Grow-only scratch buffers reused across calls
+        self._co_buf = np.empty(0, dtype=np.float32)
+        self._clip_buf = np.empty((0, 4), dtype=np.float32)
         logger.debug("BoundingBoxCalculator initialized")
     
-    def calculate_bbox(
+    def clear_cache(self) -> None:
+        """Drop all cached vertex arrays.
+        
+        Call this after editing mesh geometry in place.
+        """
+        self._vertex_cache.clear()
+    
+    def _get_vertices(self, mesh: bpy.types.Mesh) -> np.ndarray:
+        """Get homogeneous local-space vertices for a mesh.
+        
+        Args:
+            mesh: Blender mesh data.
+            
+        Returns:
+            Array of shape (N, 4) with w set to 1.
+        """
+        num_vertices = len(mesh.vertices)
+        key = (mesh.session_uid, num_vertices)
+        
+        vertices = self._vertex_cache.get(key)
+        if vertices is not None:
+            self._vertex_cache.move_to_end(key)
+            return vertices
+        
+        if self._co_buf.size < num_vertices * 3:
+            self._co_buf = np.empty(num_vertices * 3, dtype=np.float32)
+        
+        coords = self._co_buf[:num_vertices * 3]
+        mesh.vertices.foreach_get("co", coords)
+        vertices = np.ones((num_vertices, 4), dtype=np.float32)
+        vertices[:, :3] = coords.reshape(num_vertices, 3)
+        
+        self._vertex_cache[key] = vertices
+        if len(self._vertex_cache) > self.cache_size:
+            self._vertex_cache.popitem(last=False)
+        
+        return vertices
+    
+    def compile(
         self,
-        obj: bpy.types.Object,
         camera: Camera,
         resolution: Tuple[int, int],
-    ) -> Optional[BoundingBox]:
-        """Calculate 2D bounding box for object.
+    ) -> Callable[[bpy.types.Object], Optional[BoundingBox]]:
+        """Specialize bounding box calculation for a fixed camera and resolution.
+        
+        The view, projection and viewport (pixel scale and Y flip)
+        transforms are folded into one matrix up front, so each object
+        only costs one 4x4 product with its ``matrix_world`` and the vertex
+        projection. The returned function is valid until the camera pose,
+        lens or resolution changes.
         
         Args:
-            obj: Blender object.
             camera: Camera instance.
             resolution: Image resolution (width, height).
             
         Returns:
-            BoundingBox or None if object not visible.
+            Function mapping an object to its BoundingBox, or None if the
+            object is not visible.
         """
-        scene = bpy.context.scene
         width, height = resolution
         
-        # Get object vertices in world space
-        vertices_world = [
-            obj.matrix_world @ v.co
-            for v in obj.data.vertices
-        ]
-        
-        # Project vertices to camera space
-        vertices_2d = []
-        depsgraph = bpy.context.evaluated_depsgraph_get()
+        viewport = np.array([
+            [0.5 * width, 0.0, 0.0, 0.5 * width],
+            [0.0, -0.5 * height, 0.0, 0.5 * height],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ])
+        view_matrix = np.array(camera.camera_obj.matrix_world.inverted())
+        view_to_pixels = viewport @ camera.get_projection_matrix() @ view_matrix
         
-        for v in vertices_world:
-            # Convert to camera coordinates
-            co_camera = bpy_extras.object_utils.world_to_camera_view(
-                scene,
-                camera.camera_obj,
-                v
-            )
+        def calculate(obj: bpy.types.Object) -> Optional[BoundingBox]:
+            # Homogeneous (N, 4) local-space vertices, cached per mesh
+            if len(obj.data.vertices) == 0:
+                return None
+            
+            vertices = self._get_vertices(obj.data)
             
-            # Check if behind camera
-            if co_camera.z < 0:
-                continue
+            # Project all vertices in float32; the result is only used at
+            # pixel precision
+            mvp = (view_to_pixels @ np.array(obj.matrix_world)).astype(np.float32)
+            num_vertices = len(vertices)
+            if len(self._clip_buf) < num_vertices:
+                self._clip_buf = np.empty((num_vertices, 4), dtype=np.float32)
             
-            # Convert to pixel coordinates
-            x_pixel = int(co_camera.x * width)
-            y_pixel = int((1 - co_camera.y) * height)  # Flip Y
+            clip = np.matmul(vertices, mvp.T, out=self._clip_buf[:num_vertices])
             
-            vertices_2d.append((x_pixel, y_pixel))
+            # Calculate bounding box
+            extent = _project_and_bbox(clip, width, height)
+            if extent is None:
+                logger.debug("Object %s not visible in camera", obj.name)
+                return None
+            
+            return _make_bbox(extent, width, height)
         
-        if not vertices_2d:
-            logger.debug(f"Object {obj.name} not visible in camera")
-            return None
+        return calculate
+    
+    def calculate_bboxes_batch(
+        self,
+        objects: Sequence[bpy.types.Object],
+        camera: Camera,
+        resolution: Tuple[int, int],
+        class_ids: Optional[Sequence[int]] = None,
+    ) -> BoundingBoxArray:
+        """Calculate 2D bounding boxes for several objects at once.
         
-        # Calculate bounding box
-        x_coords = [v[0] for v in vertices_2d]
-        y_coords = [v[1] for v in vertices_2d]
+        The model-view-projection matrices of all objects are built in one
+        stacked product and the vertices are projected into one buffer,
+        which is reduced to per-object extents with np.minimum.reduceat and
+        np.maximum.reduceat. Results match compile() for each object.
         
-        x_min = max(0, min(x_coords))
-        x_max = min(width, max(x_coords))
-        y_min = max(0, min(y_coords))
-        y_max = min(height, max(y_coords))
+        Args:
+            objects: Blender objects.
+            camera: Camera instance.
+            resolution: Image resolution (width, height).
+            class_ids: Class ID of each object, stored with its box.
+                Defaults to 0.
+            
+        Returns:
+            Bounding boxes of the visible objects with a non-empty box, in
+            the order of ``objects``.
+        """
+        width, height = resolution
+        if class_ids is None:
+            class_ids = [0] * len(objects)
+        
+        # Objects without vertices can never have a box
+        meshes: List[Tuple[bpy.types.Object, int]] = [
+            (obj, class_id)
+            for obj, class_id in zip(objects, class_ids)
+            if len(obj.data.vertices) > 0
+        ]
+        if not meshes:
+            return BoundingBoxArray(0)
         
-        # Check if bbox has valid area
+        viewport = np.array([
+            [0.5 * width, 0.0, 0.0, 0.5 * width],
+            [0.0, -0.5 * height, 0.0, 0.5 * height],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ])
+        view_matrix = np.array(camera.camera_obj.matrix_world.inverted())
+        view_to_pixels = viewport @ camera.get_projection_matrix() @ view_matrix
+        
+        # (N, 4, 4) model-view-projection matrices in one product
+        world = np.stack([np.array(obj.matrix_world) for obj, _ in meshes])
+        mvps = np.matmul(view_to_pixels, world).astype(np.float32)
+        
+        vertex_arrays = [self._get_vertices(obj.data) for obj, _ in meshes]
+        counts = np.array([len(vertices) for vertices in vertex_arrays])
+        offsets = np.zeros(len(counts), dtype=np.intp)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        total = int(counts.sum())
+        
+        if len(self._clip_buf) < total:
+            self._clip_buf = np.empty((total, 4), dtype=np.float32)
+        clip = self._clip_buf[:total]
+        for vertices, mvp, start, count in zip(vertex_arrays, mvps, offsets, counts):
+            np.matmul(vertices, mvp.T, out=clip[start:start + count])
+        
+        # Vertices behind the camera must not contribute to min or max
+        in_front = clip[:, 3] > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pixels = clip[:, :2] / clip[:, 3:4]
+        p_min = np.minimum.reduceat(
+            np.where(in_front[:, None], pixels, np.inf), offsets, axis=0
+        )
+        p_max = np.maximum.reduceat(
+            np.where(in_front[:, None], pixels, -np.inf), offsets, axis=0
+        )
+        visible = np.logical_or.reduceat(in_front, offsets)
+        
+        # Truncate toward zero and clamp, as int() in _project_and_bbox()
+        p_min = np.trunc(np.where(visible[:, None], p_min, 0.0))
+        p_max = np.trunc(np.where(visible[:, None], p_max, 0.0))
+        x_min = np.maximum(p_min[:, 0], 0).astype(np.int64)
+        y_min = np.maximum(p_min[:, 1], 0).astype(np.int64)
+        x_max = np.minimum(p_max[:, 0], width).astype(np.int64)
+        y_max = np.minimum(p_max[:, 1], height).astype(np.int64)
         bbox_width = x_max - x_min
         bbox_height = y_max - y_min
         
-        if bbox_width <= 0 or bbox_height <= 0:
-            return None
-        
-        # Calculate normalized coordinates
-        x_center = (x_min + x_max) / 2 / width
-        y_center = (y_min + y_max) / 2 / height
-        width_norm = bbox_width / width
-        height_norm = bbox_height / height
-        area = bbox_width * bbox_height
-        
-        return BoundingBox(
-            x_min=x_min,
-            y_min=y_min,
-            x_max=x_max,
-            y_max=y_max,
-            x_center=x_center,
-            y_center=y_center,
-            width=width_norm,
-            height=height_norm,
-            area=area,
-        )
\ No newline at end of file
+        keep = visible & (bbox_width > 0) & (bbox_height > 0)
+        size = int(keep.sum())
+        
+        result = BoundingBoxArray(size)
+        result._ints[:, :size] = np.stack([
+            x_min[keep],
+            y_min[keep],
+            x_max[keep],
+            y_max[keep],
+            (bbox_width * bbox_height)[keep],
+            np.asarray([class_id for _, class_id in meshes])[keep],
+        ])
+        result._floats[:, :size] = np.stack([
+            (x_min + x_max)[keep] / 2 / width,
+            (y_min + y_max)[keep] / 2 / height,
+            bbox_width[keep] / width,
+            bbox_height[keep] / height,
+        ])
+        result._size = size
+        return result
+    
+    def calculate_bbox(
+        self,
+        obj: bpy.types.Object,
+        camera: Camera,
+        resolution: Tuple[int, int],
+    ) -> Optional[BoundingBox]:
+        """Calculate 2D bounding box for object.
+        
+        For many objects under the same camera, use compile() once instead.
+        
+        Args:
+            obj: Blender object.
+            camera: Camera instance.
+            resolution: Image resolution (width, height).
+            
+        Returns:
+            BoundingBox or None if object not visible.
+        """
+        return self.compile(camera, resolution)(obj)
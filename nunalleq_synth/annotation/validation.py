@@ -5,19 +5,39 @@
 """Annotation validation utilities."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from nunalleq_synth.annotation.bbox import BoundingBox
+import numpy as np
+
+from nunalleq_synth.annotation.bbox import BoundingBox, BoundingBoxArray
+from nunalleq_synth.utils.io import parse_yolo_label
 
 logger = logging.getLogger(__name__)
 
 
 class AnnotationValidator:
-    """Validates generated annotations."""
+    """Validates generated annotations.
+    
+    Attributes:
+        num_workers: Number of threads used to check label files.
+    """
+    
+    __slots__ = ("num_workers",)
     
-    def __init__(self) -> None:
-        """Initialize annotation validator."""
+    def __init__(self, num_workers: Optional[int] = None) -> None:
+        """Initialize annotation validator.
+        
+        Args:
+            num_workers: Number of threads used to check label files.
+                If None, uses twice the CPU count since the work is
+                dominated by file reads.
+        """
+        if num_workers is None:
+            num_workers = (os.cpu_count() or 1) * 2
+        self.num_workers = num_workers
         logger.debug("AnnotationValidator initialized")
     
     def validate_bbox(
@@ -38,7 +58,7 @@ class AnnotationValidator:
         """
         # Check minimum area
         if bbox.area < min_area:
-            logger.debug(f"BBox rejected: area {bbox.area} < {min_area}")
+            logger.debug("BBox rejected: area %s < %s", bbox.area, min_area)
             return False
         
         # Check if within image bounds
@@ -52,6 +72,135 @@ class AnnotationValidator:
         
         return True
     
+    def validate_bboxes(
+        self,
+        bboxes: BoundingBoxArray,
+        min_area: int = 100,
+        min_visibility: float = 0.3,
+    ) -> np.ndarray:
+        """Validate all bounding boxes of an array at once.
+        
+        Applies the same checks as validate_bbox() to whole columns.
+        
+        Args:
+            bboxes: Bounding boxes to validate.
+            min_area: Minimum area in pixels.
+            min_visibility: Minimum visibility ratio (0-1).
+            
+        Returns:
+            Boolean mask, True for valid boxes.
+        """
+        mask = (
+            (bboxes.area >= min_area)
+            & (bboxes.x_center >= 0) & (bboxes.x_center <= 1)
+            & (bboxes.y_center >= 0) & (bboxes.y_center <= 1)
+            & (bboxes.width > 0) & (bboxes.width <= 1)
+            & (bboxes.height > 0) & (bboxes.height <= 1)
+        )
+        
+        # Counting rejections costs a pass over the mask, so only do it
+        # when the message is emitted
+        if logger.isEnabledFor(logging.DEBUG) and not mask.all():
+            logger.debug("BBoxes rejected: %s of %s", int((~mask).sum()), len(bboxes))
+        
+        return mask
+    
+    def _check_label_file(self, label_file: Path) -> Optional[str]:
+        """Validate a single YOLO label file.
+        
+        The file is parsed with parse_yolo_label() and value ranges are
+        checked with vectorized comparisons.
+        
+        Args:
+            label_file: Path to label file.
+            
+        Returns:
+            Error message, or None if the file is valid.
+        """
+        try:
+            try:
+                arr = parse_yolo_label(label_file)
+            except ValueError as e:
+                return str(e)
+            
+            centers = arr[:, 1:3]
+            if not np.all((centers >= 0) & (centers <= 1)):
+                return f"Invalid coordinates in {label_file}"
+            
+            dims = arr[:, 3:5]
+            if not np.all((dims > 0) & (dims <= 1)):
+                return f"Invalid dimensions in {label_file}"
+            
+            return None
+        
+        except Exception as e:
+            return f"Error reading {label_file}: {e}"
+    
+    def _validate_one(self, image_name: str, labels_dir: Path) -> Optional[str]:
+        """Validate the label file belonging to one image.
+        
+        Args:
+            image_name: File name of the image.
+            labels_dir: Directory containing label files.
+            
+        Returns:
+            Error message, or None if the label is valid.
+        """
+        stem = os.path.splitext(image_name)[0]
+        label_file = labels_dir / f"{stem}.txt"
+        
+        if not label_file.exists():
+            return f"Missing label file: {label_file}"
+        
+        return self._check_label_file(label_file)
+    
+    def validate_split(
+        self,
+        dataset_dir: Path,
+        split: str,
+    ) -> Tuple[int, int, List[str]]:
+        """Validate the labels of one dataset split.
+        
+        Args:
+            dataset_dir: Root directory of dataset.
+            split: Split name ('train', 'test', or 'val').
+            
+        Returns:
+            Tuple of (valid_count, invalid_count, error_messages).
+        """
+        images_dir = dataset_dir / split / 'images'
+        labels_dir = dataset_dir / split / 'labels'
+        
+        if not images_dir.exists() or not labels_dir.exists():
+            return 0, 0, [f"Missing directories for {split} split"]
+        
+        valid_count = 0
+        invalid_count = 0
+        errors = []
+        
+        # scandir avoids a Path object and stat call per entry
+        with os.scandir(images_dir) as it:
+            image_names = sorted(
+                entry.name for entry in it
+                if entry.name.endswith('.jpg')
+                and entry.is_file()
+            )
+        
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            results = executor.map(
+                lambda image_name: self._validate_one(image_name, labels_dir),
+                image_names,
+            )
+            
+            for error in results:
+                if error is None:
+                    valid_count += 1
+                else:
+                    errors.append(error)
+                    invalid_count += 1
+        
+        return valid_count, invalid_count, errors
+    
     def validate_dataset(
         self,
         dataset_dir: Path,
@@ -69,77 +218,13 @@ class AnnotationValidator:
         errors = []
         
         for split in ['train', 'test', 'val']:
-            images_dir = dataset_dir / split / 'images'
-            labels_dir = dataset_dir / split / 'labels'
-            
-            if not images_dir.exists() or not labels_dir.exists():
-                errors.append(f"Missing directories for {split} split")
-                continue
-            
-            image_files = sorted(images_dir.glob('*.jpg'))
-            
-            for img_file in image_files:
-                label_file = labels_dir / f"{img_file.stem}.txt"
-                
-                if not label_file.exists():
-                    errors.append(f"Missing label file: {label_file}")
-                    invalid_count += 1
-                    continue
-                
-                # Validate label file
-                try:
-                    with open(label_file, 'r') as f:
-                        lines = f.readlines()
-                    
-                    if not lines:
-                        errors.append(f"Empty label file: {label_file}")
-                        invalid_count += 1
-                        continue
-                    
-                    # Parse and validate each annotation
-                    for line in lines:
-                        parts = line.strip().split()
-                        if len(parts) != 5:
-                            errors.append(
-                                f"Invalid format in {label_file}: {line.strip()}"
-                            )
-                            invalid_count += 1
-                            break
-                        
-                        # Check if values are valid
-                        try:
-                            class_id = int(parts[0])
-                            x_center = float(parts[1])
-                            y_center = float(parts[2])
-                            width = float(parts[3])
-                            height = float(parts[4])
-                            
-                            if not (0 <= x_center <= 1 and 0 <= y_center <= 1):
-                                errors.append(
-                                    f"Invalid coordinates in {label_file}"
-                                )
-                                invalid_count += 1
-                                break
-                            
-                            if not (0 < width <= 1 and 0 < height <= 1):
-                                errors.append(
-                                    f"Invalid dimensions in {label_file}"
-                                )
-                                invalid_count += 1
-                                break
-                        
-                        except ValueError:
-                            errors.append(
-                                f"Non-numeric values in {label_file}"
-                            )
-                            invalid_count += 1
-                            break
-                    else:
-                        valid_count += 1
-                
-                except Exception as e:
-                    errors.append(f"Error reading {label_file}: {e}")
-                    invalid_count += 1
+            split_valid, split_invalid, split_errors = self.validate_split(
+                dataset_dir,
+                split,
+            )
+            valid_count += split_valid
+            invalid_count += split_invalid
+            errors.extend(split_errors)
         
         logger.info(f"Validation complete: {valid_count} valid, {invalid_count} invalid")
-        return valid_count, invalid_count, errors
\ No newline at end of file
+        return valid_count, invalid_count, errors
@@ -5,10 +5,11 @@
 """YOLO format annotation generation."""
 
 import logging
+import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
-from nunalleq_synth.annotation.bbox import BoundingBox
+from nunalleq_synth.annotation.bbox import BoundingBox, BoundingBoxArray
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ class YOLOAnnotator:
         class_names: List of class names.
     """
     
+    # One label line: class_id x_center y_center width height
+    _LINE_FMT = b"%d %.6f %.6f %.6f %.6f\n"
+    
     def __init__(self, class_names: List[str]) -> None:
         """Initialize YOLO annotator.
         
@@ -30,42 +34,92 @@ class YOLOAnnotator:
             class_names: List of class names.
         """
         self.class_names = class_names
-        logger.debug(f"YOLOAnnotator initialized with {len(class_names)} classes")
+        logger.debug("YOLOAnnotator initialized with %s classes", len(class_names))
+    
+    def format_annotations(
+        self,
+        annotations: Union[List[Tuple[int, BoundingBox]], BoundingBoxArray],
+    ) -> bytes:
+        """Format annotations as the contents of a YOLO label file.
+        
+        Args:
+            annotations: List of (class_id, bbox) tuples, or a
+                BoundingBoxArray holding the class IDs.
+            
+        Returns:
+            Label file contents, one line per annotation.
+        """
+        if isinstance(annotations, BoundingBoxArray):
+            rows = zip(
+                annotations.class_id.tolist(),
+                annotations.x_center.tolist(),
+                annotations.y_center.tolist(),
+                annotations.width.tolist(),
+                annotations.height.tolist(),
+            )
+        else:
+            rows = (
+                (class_id, bbox.x_center, bbox.y_center, bbox.width, bbox.height)
+                for class_id, bbox in annotations
+            )
+        
+        # Labels are plain ASCII, so format bytes and skip text encoding
+        line_fmt = self._LINE_FMT
+        return b"".join([line_fmt % row for row in rows])
     
     def save_annotations(
         self,
-        annotations: List[Tuple[int, BoundingBox]],
-        output_path: Path,
+        annotations: Union[List[Tuple[int, BoundingBox]], BoundingBoxArray],
+        output_path: Union[str, Path],
         resolution: Tuple[int, int],
     ) -> bool:
         """Save annotations in YOLO format.
         
         Args:
-            annotations: List of (class_id, bbox) tuples.
-            output_path: Output file path.
+            annotations: List of (class_id, bbox) tuples, or a
+                BoundingBoxArray holding the class IDs.
+            output_path: Output file path, as a string or Path.
             resolution: Image resolution (width, height).
             
         Returns:
             True if successful, False otherwise.
         """
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
             
-            with open(output_path, 'w') as f:
-                for class_id, bbox in annotations:
-                    # YOLO format line
-                    line = (
-                        f"{class_id} "
-                        f"{bbox.x_center:.6f} "
-                        f"{bbox.y_center:.6f} "
-                        f"{bbox.width:.6f} "
-                        f"{bbox.height:.6f}\n"
-                    )
-                    f.write(line)
+            with open(output_path, 'wb') as f:
+                f.write(self.format_annotations(annotations))
             
-            logger.debug(f"Saved {len(annotations)} annotations to {output_path}")
+            logger.debug("Saved %s annotations to %s", len(annotations), output_path)
             return True
             
         except Exception as e:
             logger.error(f"Failed to save annotations: {e}")
             return False
+
+
+def write_label_files(labels: List[Tuple[str, bytes]]) -> int:
+    """Write formatted label files.
+    
+    Used to flush labels buffered during generation, typically from a
+    background thread. The parent directories must already exist.
+    
+    Args:
+        labels: (output path, contents from format_annotations()) pairs.
+        
+    Returns:
+        Number of files written.
+    """
+    written = 0
+    for output_path, data in labels:
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            written += 1
+        except OSError as e:
+            logger.error(f"Failed to save annotations to {output_path}: {e}")
+    
+    logger.debug("Wrote %s label files", written)
+    return written
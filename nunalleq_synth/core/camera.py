@@ -32,6 +32,10 @@ class Camera:
         self.camera_obj: Optional[bpy.types.Object] = None
         self.camera_data: Optional[bpy.types.Camera] = None
         
+        # Last projection matrix and the settings it was computed from
+        self._proj_key: Optional[Tuple] = None
+        self._proj_matrix: Optional[np.ndarray] = None
+        
         self._create_camera()
         logger.info(f"Camera '{name}' initialized")
     
@@ -58,7 +62,7 @@ class Camera:
             location: Camera location as (x, y, z).
         """
         self.camera_obj.location = location
-        logger.debug(f"Camera location set to {location}")
+        logger.debug("Camera location set to %s", location)
     
     def set_rotation(self, rotation: Tuple[float, float, float]) -> None:
         """Set camera rotation in Euler angles.
@@ -67,7 +71,7 @@ class Camera:
             rotation: Rotation as (x, y, z) in radians.
         """
         self.camera_obj.rotation_euler = rotation
-        logger.debug(f"Camera rotation set to {rotation}")
+        logger.debug("Camera rotation set to %s", rotation)
     
     def look_at(self, target: Tuple[float, float, float]) -> None:
         """Point camera at target location.
@@ -82,7 +86,7 @@ class Camera:
         rot_quat = direction.to_track_quat('-Z', 'Y')
         self.camera_obj.rotation_euler = rot_quat.to_euler()
         
-        logger.debug(f"Camera looking at {target}")
+        logger.debug("Camera looking at %s", target)
     
     def add_track_to_constraint(self, target_obj: bpy.types.Object) -> None:
         """Add tracking constraint to follow an object.
@@ -95,7 +99,7 @@ class Camera:
         constraint.track_axis = 'TRACK_NEGATIVE_Z'
         constraint.up_axis = 'UP_Y'
         
-        logger.debug(f"Camera tracking {target_obj.name}")
+        logger.debug("Camera tracking %s", target_obj.name)
     
     def set_focal_length(self, focal_length: float) -> None:
         """Set camera focal length.
@@ -104,7 +108,7 @@ class Camera:
             focal_length: Focal length in mm.
         """
         self.camera_data.lens = focal_length
-        logger.debug(f"Focal length set to {focal_length}mm")
+        logger.debug("Focal length set to %smm", focal_length)
     
     def set_depth_of_field(
         self,
@@ -121,25 +125,50 @@ class Camera:
         self.camera_data.dof.focus_distance = focus_distance
         self.camera_data.dof.aperture_fstop = aperture_fstop
         
-        logger.debug(f"DOF enabled: distance={focus_distance}, f-stop={aperture_fstop}")
+        logger.debug("DOF enabled: distance=%s, f-stop=%s", focus_distance, aperture_fstop)
     
     def get_projection_matrix(self) -> np.ndarray:
         """Get camera projection matrix.
         
+        The matrix only depends on render and lens settings, not on the
+        camera pose, so it is reused until one of those settings changes.
+        
         Returns:
-            4x4 projection matrix as numpy array.
+            4x4 projection matrix as read-only numpy array.
         """
         render = bpy.context.scene.render
-        modelview_matrix = self.camera_obj.matrix_world.inverted()
-        projection_matrix = self.camera_obj.calc_matrix_camera(
-            bpy.context.evaluated_depsgraph_get(),
-            x=render.resolution_x,
-            y=render.resolution_y,
-            scale_x=render.pixel_aspect_x,
-            scale_y=render.pixel_aspect_y,
+        data = self.camera_data
+        key = (
+            render.resolution_x,
+            render.resolution_y,
+            render.pixel_aspect_x,
+            render.pixel_aspect_y,
+            data.type,
+            data.lens,
+            data.ortho_scale,
+            data.sensor_width,
+            data.sensor_height,
+            data.sensor_fit,
+            data.shift_x,
+            data.shift_y,
+            data.clip_start,
+            data.clip_end,
         )
         
-        return np.array(projection_matrix)
+        if key != self._proj_key:
+            projection_matrix = self.camera_obj.calc_matrix_camera(
+                bpy.context.evaluated_depsgraph_get(),
+                x=render.resolution_x,
+                y=render.resolution_y,
+                scale_x=render.pixel_aspect_x,
+                scale_y=render.pixel_aspect_y,
+            )
+            matrix = np.array(projection_matrix)
+            matrix.setflags(write=False)
+            self._proj_key = key
+            self._proj_matrix = matrix
+        
+        return self._proj_matrix
     
     def world_to_camera(
         self,
@@ -148,14 +177,16 @@ class Camera:
         """Convert world coordinates to camera coordinates.
         
         Args:
-            world_coords: World coordinates as (x, y, z).
+            world_coords: World coordinates as (x, y, z), or an (N, 3)
+                array of points.
             
         Returns:
-            Camera coordinates.
+            Camera coordinates as float32, with the same shape as the input.
         """
         # FIXED: Properly compute and return camera coordinates
-        camera_matrix = self.camera_obj.matrix_world.inverted()
-        # Convert numpy array to Vector for matrix multiplication
-        world_vec = Vector(world_coords)
-        camera_coords = camera_matrix @ world_vec
-        return np.array(camera_coords)
\ No newline at end of file
+        camera_matrix = np.array(
+            self.camera_obj.matrix_world.inverted(),
+            dtype=np.float32,
+        )
+        world_coords = np.asarray(world_coords, dtype=np.float32)
+        return world_coords @ camera_matrix[:3, :3].T + camera_matrix[:3, 3]
\ No newline at end of file
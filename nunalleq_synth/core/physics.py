@@ -1,11 +1,15 @@
 # nunalleq_synth/core/physics.py
 """Physics simulation for realistic object placement."""
 
+import hashlib
 import logging
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
 import bpy
 import numpy as np
+from mathutils import Matrix
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,10 @@ class PhysicsSimulator:
         gravity: Gravity vector (x, y, z).
         simulation_steps: Number of simulation frames.
         substeps: Substeps per frame for accuracy.
+        adaptive: Whether to scale substeps and solver iterations with
+            the number of dynamic bodies, using substeps as the maximum.
+        cache_dir: Directory for cached simulation results, or None to
+            always simulate.
     """
     
     def __init__(
@@ -24,6 +32,8 @@ class PhysicsSimulator:
         gravity: Tuple[float, float, float] = (0.0, 0.0, -9.81),
         simulation_steps: int = 120,
         substeps: int = 10,
+        adaptive: bool = True,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """Initialize physics simulator.
         
@@ -31,10 +41,21 @@ class PhysicsSimulator:
             gravity: Gravity vector as (x, y, z).
             simulation_steps: Number of frames to simulate.
             substeps: Substeps per frame for accuracy.
+            adaptive: Whether to scale substeps and solver iterations with
+                the number of dynamic bodies, using substeps as the maximum.
+            cache_dir: Directory for cached simulation results. If set, the
+                final transforms of a simulated scene are stored there and
+                reused when the same initial scene is simulated again.
         """
         self.gravity = gravity
         self.simulation_steps = simulation_steps
         self.substeps = substeps
+        self.adaptive = adaptive
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._last_dynamic_count: Optional[int] = None
+        
+        # Objects dropped inside batch(), given rigid bodies on exit
+        self._pending: Optional[List[bpy.types.Object]] = None
         
         self._setup_physics()
         logger.info("Physics simulator initialized")
@@ -46,7 +67,38 @@ class PhysicsSimulator:
         scene.rigidbody_world.substeps_per_frame = self.substeps
         scene.rigidbody_world.solver_iterations = 10
         
-        logger.debug(f"Physics configured: gravity={self.gravity}, steps={self.simulation_steps}")
+        logger.debug(
+            "Physics configured: gravity=%s, steps=%s",
+            self.gravity,
+            self.simulation_steps,
+        )
+    
+    def _update_solver_settings(self) -> None:
+        """Match substeps and solver iterations to the number of dynamic bodies.
+        
+        A few bodies falling onto a ground plane settle fine with far fewer
+        solver iterations than a crowded pile. Settings are only rewritten
+        when the dynamic body count changes.
+        """
+        scene = bpy.context.scene
+        dynamic_count = len(self._get_dynamic_objects())
+        
+        if dynamic_count == self._last_dynamic_count:
+            return
+        
+        substeps = min(self.substeps, max(2, dynamic_count // 4))
+        solver_iterations = max(4, min(10, dynamic_count // 8))
+        
+        scene.rigidbody_world.substeps_per_frame = substeps
+        scene.rigidbody_world.solver_iterations = solver_iterations
+        self._last_dynamic_count = dynamic_count
+        
+        logger.debug(
+            "Solver set for %s dynamic bodies: substeps=%s, iterations=%s",
+            dynamic_count,
+            substeps,
+            solver_iterations,
+        )
     
     def add_rigid_body(
         self,
@@ -55,6 +107,7 @@ class PhysicsSimulator:
         mass: float = 1.0,
         friction: float = 0.5,
         restitution: float = 0.3,
+        collision_shape: Optional[str] = None,
     ) -> None:
         """Add rigid body physics to an object.
         
@@ -64,6 +117,10 @@ class PhysicsSimulator:
             mass: Object mass in kg.
             friction: Friction coefficient (0-1).
             restitution: Bounciness (0-1).
+            collision_shape: Collision shape (e.g. 'BOX', 'CONVEX_HULL',
+                'MESH'). If None, PASSIVE bodies get a convex hull, or a box
+                for meshes with 8 vertices or fewer, and ACTIVE bodies keep
+                Blender's default.
         """
         # Select object
         bpy.ops.object.select_all(action='DESELECT')
@@ -77,10 +134,102 @@ class PhysicsSimulator:
         obj.rigid_body.friction = friction
         obj.rigid_body.restitution = restitution
         
-        if body_type == "PASSIVE":
-            obj.rigid_body.collision_shape = 'MESH'
+        shape = collision_shape or self._default_collision_shape(obj, body_type)
+        if shape is not None:
+            obj.rigid_body.collision_shape = shape
+        
+        logger.debug("Added %s rigid body to %s", body_type, obj.name)
+    
+    @staticmethod
+    def _default_collision_shape(
+        obj: bpy.types.Object,
+        body_type: str,
+    ) -> Optional[str]:
+        """Choose a collision shape for an object.
+        
+        Triangle mesh collision is far slower than primitive shapes, so
+        PASSIVE bodies use a convex hull, or a box for low-poly geometry
+        such as the ground plane.
         
-        logger.debug(f"Added {body_type} rigid body to {obj.name}")
+        Args:
+            obj: Blender object.
+            body_type: "ACTIVE" or "PASSIVE".
+            
+        Returns:
+            Collision shape, or None to keep Blender's default.
+        """
+        if body_type != "PASSIVE":
+            return None
+        
+        if isinstance(obj.data, bpy.types.Mesh) and len(obj.data.vertices) > 8:
+            return 'CONVEX_HULL'
+        return 'BOX'
+    
+    def add_rigid_bodies(
+        self,
+        objs: List[bpy.types.Object],
+        body_type: str = "ACTIVE",
+        mass: float = 1.0,
+        friction: float = 0.5,
+        restitution: float = 0.3,
+        collision_shape: Optional[str] = None,
+    ) -> None:
+        """Add rigid body physics to several objects with one operator call.
+        
+        Args:
+            objs: Blender objects.
+            body_type: "ACTIVE" or "PASSIVE".
+            mass: Object mass in kg.
+            friction: Friction coefficient (0-1).
+            restitution: Bounciness (0-1).
+            collision_shape: Collision shape for all objects. If None, chosen
+                per object as in add_rigid_body().
+        """
+        if not objs:
+            return
+        
+        # Select all objects at once
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in objs:
+            obj.select_set(True)
+        bpy.context.view_layer.objects.active = objs[0]
+        
+        # Add rigid bodies
+        bpy.ops.rigidbody.objects_add(type=body_type)
+        
+        for obj in objs:
+            rigid_body = obj.rigid_body
+            rigid_body.mass = mass
+            rigid_body.friction = friction
+            rigid_body.restitution = restitution
+            
+            shape = collision_shape or self._default_collision_shape(obj, body_type)
+            if shape is not None:
+                rigid_body.collision_shape = shape
+        
+        logger.debug("Added %s rigid bodies to %s objects", body_type, len(objs))
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer rigid body creation for dropped objects.
+        
+        Objects passed to drop_object() inside the block get their rigid
+        bodies in a single add_rigid_bodies() call when the block exits.
+        
+        Yields:
+            None.
+        """
+        if self._pending is not None:
+            # Already batching; the outer block flushes
+            yield
+            return
+        
+        self._pending = []
+        try:
+            yield
+            self.add_rigid_bodies(self._pending, body_type="ACTIVE")
+        finally:
+            self._pending = None
     
     def simulate(
         self,
@@ -89,6 +238,14 @@ class PhysicsSimulator:
     ) -> None:
         """Run physics simulation.
         
+        The whole frame range is baked into the rigid body point cache in
+        one pass, and the scene is evaluated only once at the final frame,
+        instead of stepping the full depsgraph frame by frame.
+        
+        With a cache directory, a scene whose rigid bodies start exactly as
+        in an earlier run gets the cached final transforms instead, and the
+        rigid body world is disabled so they are not simulated again.
+        
         Args:
             start_frame: Starting frame.
             end_frame: Ending frame. If None, uses simulation_steps.
@@ -99,19 +256,154 @@ class PhysicsSimulator:
         scene = bpy.context.scene
         scene.frame_start = start_frame
         scene.frame_end = end_frame
+        scene.rigidbody_world.enabled = True
+        
+        if self.adaptive:
+            self._update_solver_settings()
+        
+        cache_path = None
+        if self.cache_dir is not None:
+            dynamic_objs = self._get_dynamic_objects()
+            key = self._cache_key(start_frame, end_frame)
+            cache_path = self.cache_dir / f"{key}.npy"
+            if self._load_cached_result(cache_path, dynamic_objs):
+                scene.frame_set(end_frame)
+                logger.info("Physics simulation loaded from cache")
+                return
+        
+        point_cache = scene.rigidbody_world.point_cache
+        point_cache.frame_start = start_frame
+        point_cache.frame_end = end_frame
         
         logger.info(f"Running physics simulation: frames {start_frame}-{end_frame}")
         
-        # Run simulation
-        for frame in range(start_frame, end_frame + 1):
-            scene.frame_set(frame)
+        # Drop any stale bake, then bake the new range
+        if point_cache.is_baked:
+            bpy.ops.ptcache.free_bake_all()
+        self.bake_simulation()
         
         # Set to final frame
         scene.frame_set(end_frame)
+        
+        if cache_path is not None:
+            self._save_result(cache_path, dynamic_objs)
+        
         logger.debug("Physics simulation complete")
     
+    def _get_dynamic_objects(self) -> List[bpy.types.Object]:
+        """Get enabled ACTIVE rigid body objects, sorted by name."""
+        objs = [
+            obj for obj in bpy.context.scene.objects
+            if obj.rigid_body is not None
+            and obj.rigid_body.type == 'ACTIVE'
+            and obj.rigid_body.enabled
+        ]
+        return sorted(objs, key=lambda obj: obj.name)
+    
+    def _cache_key(self, start_frame: int, end_frame: int) -> str:
+        """Hash the initial state of enabled rigid bodies and solver settings.
+        
+        Transforms are read from location, rotation and scale rather than
+        matrix_world, which is not updated for dropped objects until the
+        depsgraph is evaluated. Disabled bodies, such as parked objects,
+        take no part in the simulation and are left out.
+        
+        Args:
+            start_frame: Starting frame.
+            end_frame: Ending frame.
+            
+        Returns:
+            Hex digest identifying the simulation.
+        """
+        scene = bpy.context.scene
+        rigid_body_world = scene.rigidbody_world
+        
+        state = [
+            tuple(self.gravity),
+            start_frame,
+            end_frame,
+            rigid_body_world.substeps_per_frame,
+            rigid_body_world.solver_iterations,
+        ]
+        
+        bodies = sorted(
+            (
+                obj for obj in scene.objects
+                if obj.rigid_body is not None and obj.rigid_body.enabled
+            ),
+            key=lambda obj: obj.name,
+        )
+        for obj in bodies:
+            rigid_body = obj.rigid_body
+            state.append((
+                obj.name,
+                tuple(obj.location),
+                obj.rotation_mode,
+                tuple(obj.rotation_euler),
+                tuple(obj.scale),
+                rigid_body.type,
+                rigid_body.mass,
+                rigid_body.friction,
+                rigid_body.restitution,
+                rigid_body.collision_shape,
+                len(obj.data.vertices) if isinstance(obj.data, bpy.types.Mesh) else 0,
+            ))
+        
+        return hashlib.sha1(repr(state).encode()).hexdigest()
+    
+    def _load_cached_result(
+        self,
+        cache_path: Path,
+        objs: List[bpy.types.Object],
+    ) -> bool:
+        """Apply cached final transforms if available.
+        
+        Args:
+            cache_path: Cache file for the current scene.
+            objs: Dynamic objects, in the order they were cached.
+            
+        Returns:
+            True if the cached result was applied.
+        """
+        if not cache_path.exists():
+            return False
+        
+        try:
+            matrices = np.load(cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable physics cache {cache_path}: {e}")
+            return False
+        
+        if matrices.shape != (len(objs), 4, 4):
+            return False
+        
+        bpy.context.scene.rigidbody_world.enabled = False
+        for obj, matrix in zip(objs, matrices.tolist()):
+            obj.matrix_world = Matrix(matrix)
+        
+        return True
+    
+    def _save_result(self, cache_path: Path, objs: List[bpy.types.Object]) -> None:
+        """Store final transforms of dynamic objects.
+        
+        Args:
+            cache_path: Cache file for the current scene.
+            objs: Dynamic objects.
+        """
+        matrices = np.array([np.array(obj.matrix_world) for obj in objs])
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, matrices.reshape(len(objs), 4, 4))
+        except OSError as e:
+            logger.warning(f"Failed to write physics cache {cache_path}: {e}")
+    
     def bake_simulation(self) -> None:
-        """Bake physics simulation to keyframes."""
+        """Bake physics simulation to the point cache.
+        
+        Called by simulate(); only needed separately after changing the
+        scene frame range by hand.
+        """
         bpy.ops.ptcache.bake_all(bake=True)
         logger.debug("Physics simulation baked")
     
@@ -128,11 +420,38 @@ class PhysicsSimulator:
     ) -> None:
         """Drop object from specified height.
         
+        Inside batch(), the rigid body is added when the block exits. An
+        object that already has a rigid body, e.g. one parked with
+        park_object(), is re-enabled instead.
+        
         Args:
             obj: Object to drop.
             height: Drop height above surface.
             location: (x, y) location on surface.
         """
         obj.location = (location[0], location[1], height)
-        self.add_rigid_body(obj, body_type="ACTIVE")
-        logger.debug(f"Dropping {obj.name} from height {height}")
+        if obj.rigid_body is not None:
+            obj.rigid_body.enabled = True
+        elif self._pending is not None:
+            self._pending.append(obj)
+        else:
+            self.add_rigid_body(obj, body_type="ACTIVE")
+        logger.debug("Dropping %s from height %s", obj.name, height)
+    
+    def park_object(
+        self,
+        obj: bpy.types.Object,
+        location: Tuple[float, float, float] = (0.0, 0.0, -100.0),
+    ) -> None:
+        """Take a dropped object out of the simulation without deleting it.
+        
+        The rigid body is disabled, so the object stays put as a static
+        body far below the scene until drop_object() is called on it again.
+        
+        Args:
+            obj: Object to park.
+            location: Location to move the object to.
+        """
+        if obj.rigid_body is not None:
+            obj.rigid_body.enabled = False
+        obj.location = location
@@ -2,8 +2,9 @@
 """Image rendering utilities."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import bpy
 
@@ -41,9 +42,19 @@ class Renderer:
         if self.config.engine == "CYCLES":
             scene.cycles.samples = self.config.samples
             
+            # Stop sampling pixels that have converged
+            threshold = self.config.adaptive_threshold
+            scene.cycles.use_adaptive_sampling = threshold > 0
+            if threshold > 0:
+                scene.cycles.adaptive_threshold = threshold
+            
+            # Keep scene data and BVH between renders
+            scene.render.use_persistent_data = True
+            
             # Enable GPU if requested
-            if self.config.use_gpu:
-                enable_gpu()
+            gpu_enabled = self.config.use_gpu and enable_gpu()
+            
+            self._setup_denoiser(scene, gpu_enabled)
         
         # Set resolution
         scene.render.resolution_x = self.config.resolution[0]
@@ -55,27 +66,53 @@ class Renderer:
         if self.config.file_format == 'JPEG':
             scene.render.image_settings.quality = self.config.quality
         
-        logger.debug(f"Renderer configured: {self.config.engine} @ {self.config.resolution}")
+        logger.debug("Renderer configured: %s @ %s", self.config.engine, self.config.resolution)
+    
+    def _setup_denoiser(self, scene: bpy.types.Scene, gpu_enabled: bool) -> None:
+        """Configure Cycles denoising.
+        
+        The OptiX denoiser needs an OptiX compute device, so OpenImageDenoise
+        is used instead when rendering on anything else.
+        
+        Args:
+            scene: Scene to configure.
+            gpu_enabled: Whether GPU rendering was enabled.
+        """
+        denoiser = self.config.denoiser
+        scene.cycles.use_denoising = denoiser is not None
+        if denoiser is None:
+            return
+        
+        if denoiser == "OPTIX":
+            preferences = bpy.context.preferences.addons["cycles"].preferences
+            if not gpu_enabled or preferences.compute_device_type != "OPTIX":
+                logger.info("OptiX not available, denoising with OpenImageDenoise")
+                denoiser = "OPENIMAGEDENOISE"
+        
+        scene.cycles.denoiser = denoiser
     
     def render(
         self,
-        output_path: Path,
+        output_path: Union[str, Path],
         animation: bool = False,
     ) -> bool:
         """Render scene to image file.
         
         Args:
-            output_path: Output file path.
+            output_path: Output file path, as a string or Path.
             animation: If True, render animation.
             
         Returns:
             True if rendering succeeded, False otherwise.
         """
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path = os.fspath(output_path)
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
             
             # Set output path
-            bpy.context.scene.render.filepath = str(output_path)
+            bpy.context.scene.render.filepath = output_path
             
             # Render
             if animation:
@@ -83,7 +120,7 @@ class Renderer:
             else:
                 bpy.ops.render.render(write_still=True)
             
-            logger.debug(f"Rendered image to {output_path}")
+            logger.debug("Rendered image to %s", output_path)
             return True
             
         except Exception as e:
@@ -6,12 +6,13 @@
 
 import logging
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 
 import bpy
 import numpy as np
 
 from nunalleq_synth.objects.loader import ObjectLoader
+from nunalleq_synth.objects.material import MaterialManager
 from nunalleq_synth.core.camera import Camera
 from nunalleq_synth.core.physics import PhysicsSimulator
 
@@ -32,54 +33,90 @@ class Scene:
         self,
         name: str = "SyntheticScene",
         resolution: Tuple[int, int] = (1920, 1080),
+        reuse: bool = False,
     ) -> None:
         """Initialize scene.
         
         Args:
             name: Scene name.
             resolution: Image resolution as (width, height).
+            reuse: If True, keep the current Blender scene and only clear
+                its objects instead of resetting to factory settings.
         """
         self.name = name
         self.resolution = resolution
-        self._setup_scene()
+        self._objects_cache: Optional[List[bpy.types.Object]] = None
+        self._setup_scene(reuse=reuse)
         
         # Initialize components
         self.camera = Camera()
         self.physics = PhysicsSimulator()
-        self.object_loader = ObjectLoader()
+        self.object_loader = ObjectLoader(on_change=self.invalidate_cache)
         
         logger.info(f"Initialized scene '{name}' at {resolution}")
     
-    def _setup_scene(self) -> None:
-        """Setup basic Blender scene."""
-        # Clear existing scene
-        bpy.ops.wm.read_factory_settings(use_empty=True)
+    def _setup_scene(self, reuse: bool = False) -> None:
+        """Setup basic Blender scene.
         
-        # Create new scene
-        bpy.ops.scene.new(type='NEW')
-        scene = bpy.context.scene
-        scene.name = self.name
+        Output format settings are left to Renderer, which owns them.
+        
+        Args:
+            reuse: If True, clear the current scene instead of resetting.
+        """
+        if reuse:
+            scene = bpy.context.scene
+            scene.name = self.name
+            self.clear()
+        else:
+            # Clear existing scene
+            bpy.ops.wm.read_factory_settings(use_empty=True)
+            
+            # Create new scene
+            bpy.ops.scene.new(type='NEW')
+            scene = bpy.context.scene
+            scene.name = self.name
         
         # Set render settings
         scene.render.resolution_x = self.resolution[0]
         scene.render.resolution_y = self.resolution[1]
         scene.render.resolution_percentage = 100
-        scene.render.image_settings.file_format = 'JPEG'
-        scene.render.image_settings.quality = 95
         
         # Set up world
-        world = bpy.data.worlds.new(name="World")
-        scene.world = world
-        world.use_nodes = True
+        if scene.world is None or not reuse:
+            world = bpy.data.worlds.new(name="World")
+            scene.world = world
+        scene.world.use_nodes = True
         
         logger.debug("Scene setup complete")
     
     def clear(self) -> None:
-        """Clear all objects from scene."""
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False, confirm=False)
+        """Clear all objects from scene.
+        
+        Objects are removed through bpy.data instead of the select/delete
+        operators, then orphaned meshes, materials and lights are purged so
+        memory does not grow across batch iterations. Cached model
+        templates are kept since their collection has a fake user.
+        MaterialManager caches are dropped as well, since the purge can
+        free materials and node trees they point to.
+        """
+        for obj in list(bpy.context.scene.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.orphans_purge(do_recursive=True)
+        MaterialManager.clear_cache()
+        self.invalidate_cache()
         logger.debug("Scene cleared")
     
+    def remove_objects(self, objs: List[bpy.types.Object]) -> None:
+        """Remove specific objects from the scene and Blender data.
+        
+        Args:
+            objs: Objects to remove.
+        """
+        for obj in objs:
+            bpy.data.objects.remove(obj, do_unlink=True)
+        self.invalidate_cache()
+        logger.debug("Removed %s objects", len(objs))
+    
     def add_plane(
         self,
         size: float = 10.0,
@@ -99,8 +136,9 @@ class Scene:
         bpy.ops.mesh.primitive_plane_add(size=size, location=location)
         plane = bpy.context.active_object
         plane.name = name
+        self.invalidate_cache()
         
-        logger.debug(f"Added plane '{name}' at {location}")
+        logger.debug("Added plane '%s' at %s", name, location)
         return plane
     
     def add_light(
@@ -127,10 +165,46 @@ class Scene:
         light_object = bpy.data.objects.new(name=name, object_data=light_data)
         bpy.context.collection.objects.link(light_object)
         light_object.location = location
+        self.invalidate_cache()
         
-        logger.debug(f"Added {light_type} light '{name}' at {location}")
+        logger.debug("Added %s light '%s' at %s", light_type, name, location)
         return light_object
     
+    def add_lights(self, specs: List[Dict[str, Any]]) -> List[bpy.types.Object]:
+        """Add several lights to the scene at once.
+        
+        All light data and objects are created first, then linked to the
+        scene collection, and the view layer is updated once at the end.
+        
+        Args:
+            specs: One dict per light with the keyword arguments of
+                add_light() (light_type, energy, location, name).
+            
+        Returns:
+            Created light objects, in the order of ``specs``.
+        """
+        light_objects = []
+        for spec in specs:
+            light_type = spec.get("light_type", "POINT")
+            name = spec.get("name", "Light")
+            
+            light_data = bpy.data.lights.new(name=name, type=light_type)
+            light_data.energy = spec.get("energy", 1000.0)
+            
+            light_object = bpy.data.objects.new(name=name, object_data=light_data)
+            light_object.location = spec.get("location", (0.0, 0.0, 5.0))
+            light_objects.append(light_object)
+        
+        collection_objects = bpy.context.collection.objects
+        for light_object in light_objects:
+            collection_objects.link(light_object)
+        
+        bpy.context.view_layer.update()
+        self.invalidate_cache()
+        
+        logger.debug("Added %s lights", len(light_objects))
+        return light_objects
+    
     def set_background_color(
         self,
         color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0),
@@ -144,12 +218,25 @@ class Scene:
         bg = world.node_tree.nodes["Background"]
         bg.inputs[0].default_value = color
         
-        logger.debug(f"Set background color to {color}")
+        logger.debug("Set background color to %s", color)
+    
+    def invalidate_cache(self) -> None:
+        """Forget the cached object list.
+        
+        Called by the scene's own add/clear methods and its object loader;
+        call it after adding or removing objects through other means.
+        """
+        self._objects_cache = None
     
     def get_all_objects(self) -> List[bpy.types.Object]:
         """Get all objects in the scene.
         
+        The list is cached until the scene changes and must not be
+        modified by the caller.
+        
         Returns:
             List of Blender objects.
         """
-        return list(bpy.context.scene.objects)
\ No newline at end of file
+        if self._objects_cache is None:
+            self._objects_cache = list(bpy.context.scene.objects)
+        return self._objects_cache
\ No newline at end of file
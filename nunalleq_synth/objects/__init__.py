@@ -4,11 +4,12 @@
 # ============================================================================
 """Object loading and manipulation."""
 
-from nunalleq_synth.objects.loader import ObjectLoader
+from nunalleq_synth.objects.loader import ModelCache, ObjectLoader
 from nunalleq_synth.objects.transform import ObjectTransform
 from nunalleq_synth.objects.material import MaterialManager
 
 __all__ = [
+    "ModelCache",
     "ObjectLoader",
     "ObjectTransform",
     "MaterialManager",
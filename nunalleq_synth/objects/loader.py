@@ -3,24 +3,132 @@
 # ============================================================================
 """3D model loading utilities."""
 
+import fnmatch
 import logging
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Tuple  # FIXED: Import Tuple from typing
+from typing import Callable, Dict, Iterable, Optional, List, Tuple  # FIXED: Import Tuple from typing
 
 import bpy
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ModelCache:
+    """Cache of imported models, reused instead of re-importing GLB files.
+    
+    Each entry is a template object kept in a collection that is not
+    linked to any scene, so it is never rendered or cleared with the
+    scene. Loads served from the cache return a linked duplicate that
+    shares the template's mesh data. Templates are tracked by name, so
+    entries from a previous Blender session (e.g. after a factory reset)
+    are detected and dropped.
+    
+    Attributes:
+        templates: Template object names keyed by resolved model file path.
+        collection_name: Name of the collection holding the templates.
+        hits: Number of loads served from the cache.
+        misses: Number of loads that required a GLB import.
+    """
+    templates: Dict[str, str] = field(default_factory=dict)
+    collection_name: str = "ModelTemplates"
+    hits: int = 0
+    misses: int = 0
+    
+    def _get_collection(self) -> bpy.types.Collection:
+        """Get or create the template collection."""
+        collection = bpy.data.collections.get(self.collection_name)
+        if collection is None:
+            collection = bpy.data.collections.new(self.collection_name)
+            collection.use_fake_user = True
+        return collection
+    
+    def __contains__(self, key: str) -> bool:
+        """Check for a live template without counting a hit or miss."""
+        name = self.templates.get(key)
+        return name is not None and bpy.data.objects.get(name) is not None
+    
+    def get(self, key: str) -> Optional[bpy.types.Object]:
+        """Get the template object for a model file.
+        
+        Args:
+            key: Model file path.
+            
+        Returns:
+            Template object or None if not cached.
+        """
+        name = self.templates.get(key)
+        template = bpy.data.objects.get(name) if name is not None else None
+        
+        if template is None:
+            self.templates.pop(key, None)
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return template
+    
+    def put(self, key: str, obj: bpy.types.Object) -> None:
+        """Store a copy of an object as the template for a model.
+        
+        Args:
+            key: Model file path.
+            obj: Freshly imported object.
+        """
+        template = obj.copy()
+        template.name = f"{obj.name}.template"
+        template.hide_render = True
+        self._get_collection().objects.link(template)
+        self.templates[key] = template.name
+    
+    def clear(self) -> None:
+        """Forget all cached templates and reset statistics."""
+        self.templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class ObjectLoader:
     """Loads 3D models into Blender scene.
     
     Handles loading of .glb files and manages imported objects.
+    
+    Repeated loads of the same file are served from a model cache as
+    linked duplicates instead of re-importing the GLB.
+    
+    Attributes:
+        cache: Model cache, or None if caching is disabled.
+        loaded_objects: Loaded objects keyed by ``name_full``, in load order.
+        on_change: Optional callback run after objects are added or removed.
     """
     
-    def __init__(self) -> None:
-        """Initialize object loader."""
-        self.loaded_objects: List[bpy.types.Object] = []
+    def __init__(
+        self,
+        cache: Optional[ModelCache] = None,
+        use_cache: bool = True,
+        on_change: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Initialize object loader.
+        
+        Args:
+            cache: Model cache to share between loaders. A new cache is
+                created if not provided.
+            use_cache: If False, every load imports the GLB file.
+            on_change: Optional callback run after objects are added or
+                removed, e.g. Scene.invalidate_cache.
+        """
+        if not use_cache:
+            cache = None
+        elif cache is None:
+            cache = ModelCache()
+        
+        self.cache = cache
+        self.on_change = on_change
+        # Insertion-ordered, keyed by name_full for O(1) removal
+        self.loaded_objects: Dict[str, bpy.types.Object] = {}
         logger.debug("ObjectLoader initialized")
     
     def load_glb(
@@ -48,26 +156,30 @@ class ObjectLoader:
             return None
         
         try:
-            # Import GLB
-            bpy.ops.import_scene.gltf(
-                filepath=str(filepath),
-                loglevel=50,  # ERROR level
-            )
-            
-            # Get imported object
-            obj = bpy.context.selected_objects[0]
             obj_name = filepath.stem
-            obj.name = obj_name
+            key = str(filepath.resolve())
+            template = self.cache.get(key) if self.cache is not None else None
+            
+            if template is not None:
+                # Linked duplicate sharing the cached mesh data
+                obj = template.copy()
+                obj.hide_render = False
+                bpy.context.collection.objects.link(obj)
+                obj.name = obj_name
+            else:
+                obj = self._import_glb(filepath)
+                
+                if self.cache is not None:
+                    self.cache.put(key, obj)
             
             # Apply transformations
             obj.scale = (scale, scale, scale)
             obj.location = location
             
-            # Smooth shading
-            bpy.ops.object.shade_smooth()
-            
-            self.loaded_objects.append(obj)
-            logger.info(f"Loaded {obj_name} from {filepath}")
+            self.loaded_objects[obj.name_full] = obj
+            if self.on_change is not None:
+                self.on_change()
+            logger.info("Loaded %s from %s", obj_name, filepath)
             
             return obj
             
@@ -75,6 +187,70 @@ class ObjectLoader:
             logger.error(f"Failed to load {filepath}: {e}")
             return None
     
+    def _import_glb(self, filepath: Path) -> bpy.types.Object:
+        """Import a .glb file and set up its mesh for rendering.
+        
+        Args:
+            filepath: Path to .glb file.
+            
+        Returns:
+            Imported object, named after the file.
+        """
+        bpy.ops.import_scene.gltf(
+            filepath=str(filepath),
+            loglevel=50,  # ERROR level
+        )
+        
+        # Get imported object
+        obj = bpy.context.selected_objects[0]
+        obj.name = filepath.stem
+        
+        # Smooth shading, written straight into the mesh
+        if isinstance(obj.data, bpy.types.Mesh):
+            mesh = obj.data
+            mesh.polygons.foreach_set(
+                "use_smooth",
+                np.ones(len(mesh.polygons), dtype=bool),
+            )
+            mesh.update()
+        
+        return obj
+    
+    def prewarm(self, filepaths: Iterable[Path]) -> int:
+        """Import models into the cache before they are first loaded.
+        
+        Each model not cached yet is imported once and stored as a
+        template; the imported scene object is removed again, so later
+        loads only create linked duplicates of the cached mesh.
+        
+        Args:
+            filepaths: Paths to .glb files.
+            
+        Returns:
+            Number of models imported.
+        """
+        if self.cache is None:
+            return 0
+        
+        imported = 0
+        for filepath in filepaths:
+            key = str(filepath.resolve())
+            if key in self.cache:
+                continue
+            
+            try:
+                obj = self._import_glb(filepath)
+                self.cache.put(key, obj)
+                bpy.data.objects.remove(obj, do_unlink=True)
+                imported += 1
+            except Exception as e:
+                logger.error(f"Failed to prewarm {filepath}: {e}")
+        
+        if imported and self.on_change is not None:
+            self.on_change()
+        logger.info(f"Prewarmed model cache with {imported} models")
+        return imported
+    
     def load_multiple(
         self,
         directory: Path,
@@ -89,7 +265,14 @@ class ObjectLoader:
         Returns:
             List of loaded objects.
         """
-        glb_files = sorted(directory.glob(pattern))
+        # scandir reuses the directory entry's file type instead of a stat
+        # call per Path as glob() does
+        with os.scandir(directory) as it:
+            glb_files = [
+                Path(entry.path)
+                for entry in sorted(it, key=lambda entry: entry.name)
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()
+            ]
         logger.info(f"Found {len(glb_files)} files matching '{pattern}'")
         
         loaded = []
@@ -107,13 +290,15 @@ class ObjectLoader:
         Args:
             obj: Object to remove.
         """
+        name = obj.name_full
+        self.loaded_objects.pop(name, None)
         bpy.data.objects.remove(obj, do_unlink=True)
-        if obj in self.loaded_objects:
-            self.loaded_objects.remove(obj)
-        logger.debug(f"Removed object {obj.name}")
+        if self.on_change is not None:
+            self.on_change()
+        logger.debug("Removed object %s", name)
     
     def clear_all(self) -> None:
         """Remove all loaded objects from scene."""
-        for obj in self.loaded_objects[:]:
+        for obj in list(self.loaded_objects.values()):
             self.remove_object(obj)
         logger.debug("Cleared all loaded objects")
\ No newline at end of file
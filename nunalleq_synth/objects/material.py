@@ -5,16 +5,71 @@
 
 import logging
 import random
-from typing import Tuple  # FIXED: Import Tuple from typing
+from typing import Dict, Optional, Tuple  # FIXED: Import Tuple from typing
 
 import bpy
 
 logger = logging.getLogger(__name__)
 
+# Principled BSDF node and its Base Color, Metallic and Roughness inputs,
+# keyed by material pointer along with the node tree pointer they belong to
+_BSDFInputs = Tuple[
+    bpy.types.Node,
+    bpy.types.NodeSocket,
+    bpy.types.NodeSocket,
+    bpy.types.NodeSocket,
+]
+_bsdf_cache: Dict[int, Tuple[int, _BSDFInputs]] = {}
+_BSDF_CACHE_SIZE = 1024
+
+# Names of materials created by create_material(), keyed by their rounded
+# (color, metallic, roughness) so identical materials are shared
+_material_cache: Dict[Tuple, str] = {}
+
+
+def _get_bsdf(mat: bpy.types.Material) -> Optional[_BSDFInputs]:
+    """Get the Principled BSDF node and inputs of a material.
+    
+    Args:
+        mat: Material using nodes.
+        
+    Returns:
+        (node, base_color, metallic, roughness) or None if the material has
+        no Principled BSDF node.
+    """
+    key = mat.as_pointer()
+    tree_ptr = mat.node_tree.as_pointer()
+    
+    cached = _bsdf_cache.get(key)
+    if cached is not None and cached[0] == tree_ptr:
+        return cached[1]
+    
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if not bsdf:
+        return None
+    
+    inputs = bsdf.inputs
+    result = (bsdf, inputs['Base Color'], inputs['Metallic'], inputs['Roughness'])
+    
+    if len(_bsdf_cache) >= _BSDF_CACHE_SIZE:
+        _bsdf_cache.clear()
+    _bsdf_cache[key] = (tree_ptr, result)
+    
+    return result
+
 
 class MaterialManager:
     """Manages object materials and textures."""
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached node lookups and interned materials.
+        
+        Call this after removing materials or editing their node trees.
+        """
+        _bsdf_cache.clear()
+        _material_cache.clear()
+    
     @staticmethod
     def create_material(
         name: str,
@@ -24,6 +79,12 @@ class MaterialManager:
     ) -> bpy.types.Material:
         """Create a new material.
         
+        Materials are interned: if a material with the same color, metallic
+        and roughness (rounded to 3 decimals) was created before and still
+        exists, it is returned instead of allocating a new one, and keeps
+        its original name. Treat the result as shared; shared materials
+        are copied by randomize_material_properties() before changing them.
+        
         Args:
             name: Material name.
             color: RGBA color (0-1).
@@ -31,19 +92,35 @@ class MaterialManager:
             roughness: Roughness value (0-1).
             
         Returns:
-            Created material.
+            Created or existing material.
         """
+        key = (
+            tuple(round(c, 3) for c in color),
+            round(metallic, 3),
+            round(roughness, 3),
+        )
+        
+        cached_name = _material_cache.get(key)
+        if cached_name is not None:
+            mat = bpy.data.materials.get(cached_name)
+            if mat is not None:
+                logger.debug("Reusing material %s for %s", cached_name, name)
+                return mat
+            del _material_cache[key]
+        
         mat = bpy.data.materials.new(name=name)
         mat.use_nodes = True
         
         # Get principled BSDF node
-        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        bsdf = _get_bsdf(mat)
         if bsdf:
-            bsdf.inputs['Base Color'].default_value = color
-            bsdf.inputs['Metallic'].default_value = metallic
-            bsdf.inputs['Roughness'].default_value = roughness
+            _, base_color_input, metallic_input, roughness_input = bsdf
+            base_color_input.default_value = color
+            metallic_input.default_value = metallic
+            roughness_input.default_value = roughness
         
-        logger.debug(f"Created material: {name}")
+        _material_cache[key] = mat.name
+        logger.debug("Created material: %s", name)
         return mat
     
     @staticmethod
@@ -62,7 +139,7 @@ class MaterialManager:
         else:
             obj.data.materials.append(material)
         
-        logger.debug(f"Assigned material {material.name} to {obj.name}")
+        logger.debug("Assigned material %s to %s", material.name, obj.name)
     
     @staticmethod
     def randomize_material_properties(
@@ -84,25 +161,32 @@ class MaterialManager:
         if not mat.use_nodes:
             return
         
-        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        # Copy on write so other users of a shared material are unaffected
+        if mat.users > 1:
+            mat = mat.copy()
+            obj.data.materials[0] = mat
+        
+        bsdf = _get_bsdf(mat)
         if not bsdf:
             return
         
+        _, base_color_input, _, roughness_input = bsdf
+        
         # Randomize color
-        base_color = bsdf.inputs['Base Color'].default_value
+        base_color = base_color_input.default_value
         new_color = [
             max(0, min(1, c + random.uniform(-color_variation, color_variation)))
             for c in base_color[:3]
         ]
         new_color.append(base_color[3])  # Keep alpha
-        bsdf.inputs['Base Color'].default_value = new_color
+        base_color_input.default_value = new_color
         
         # Randomize roughness
-        base_roughness = bsdf.inputs['Roughness'].default_value
+        base_roughness = roughness_input.default_value
         new_roughness = max(
             0,
             min(1, base_roughness + random.uniform(-roughness_variation, roughness_variation))
         )
-        bsdf.inputs['Roughness'].default_value = new_roughness
+        roughness_input.default_value = new_roughness
         
-        logger.debug(f"Randomized material for {obj.name}")
\ No newline at end of file
+        logger.debug("Randomized material for %s", obj.name)
\ No newline at end of file
@@ -4,17 +4,91 @@
 """Object transformation utilities."""
 
 import logging
-from typing import Tuple  # FIXED: Import Tuple from typing
+from typing import List, Optional, Tuple  # FIXED: Import Tuple from typing
 
 import bpy
 import numpy as np
+from mathutils import Matrix
 
 logger = logging.getLogger(__name__)
 
 
+def euler_to_matrices(rotations: np.ndarray) -> np.ndarray:
+    """Convert XYZ Euler angles to rotation matrices.
+    
+    Uses Blender's XYZ convention, where X is applied first
+    (R = Rz @ Ry @ Rx).
+    
+    Args:
+        rotations: Euler angles in radians, shape (N, 3).
+        
+    Returns:
+        Rotation matrices, shape (N, 3, 3).
+    """
+    rotations = np.asarray(rotations, dtype=np.float64).reshape(-1, 3)
+    cx, cy, cz = np.cos(rotations).T
+    sx, sy, sz = np.sin(rotations).T
+    
+    matrices = np.empty((len(rotations), 3, 3))
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    
+    return matrices
+
+
 class ObjectTransform:
     """Handles object transformations in Blender."""
     
+    @staticmethod
+    def apply_transforms(
+        objs: List[bpy.types.Object],
+        locations: np.ndarray,
+        rotations: Optional[np.ndarray] = None,
+        scales: Optional[np.ndarray] = None,
+    ) -> None:
+        """Set location, rotation and scale of several objects at once.
+        
+        The world matrices for all objects are composed in one NumPy pass
+        and each object gets a single ``matrix_world`` assignment.
+        
+        Args:
+            objs: Blender objects.
+            locations: Locations, shape (N, 3).
+            rotations: XYZ Euler rotations in radians, shape (N, 3).
+                If None, objects are not rotated.
+            scales: Scale factors, shape (N, 3). If None, uses unit scale.
+        """
+        num_objs = len(objs)
+        if num_objs == 0:
+            return
+        
+        matrices = np.zeros((num_objs, 4, 4))
+        matrices[:, 3, 3] = 1.0
+        matrices[:, :3, 3] = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+        
+        if rotations is None:
+            linear = np.broadcast_to(np.eye(3), (num_objs, 3, 3))
+        else:
+            linear = euler_to_matrices(rotations)
+        
+        if scales is not None:
+            # Scale is applied before rotation, i.e. scales the columns
+            linear = linear * np.asarray(scales, dtype=np.float64).reshape(-1, 1, 3)
+        
+        matrices[:, :3, :3] = linear
+        
+        for obj, matrix in zip(objs, matrices.tolist()):
+            obj.matrix_world = Matrix(matrix)
+        
+        logger.debug("Applied transforms to %s objects", num_objs)
+    
     @staticmethod
     def set_location(
         obj: bpy.types.Object,
@@ -27,7 +101,7 @@ class ObjectTransform:
             location: New location as (x, y, z).
         """
         obj.location = location
-        logger.debug(f"Set {obj.name} location to {location}")
+        logger.debug("Set %s location to %s", obj.name, location)
     
     @staticmethod
     def set_rotation(
@@ -44,7 +118,7 @@ class ObjectTransform:
         """
         obj.rotation_mode = mode
         obj.rotation_euler = rotation
-        logger.debug(f"Set {obj.name} rotation to {rotation}")
+        logger.debug("Set %s rotation to %s", obj.name, rotation)
     
     @staticmethod
     def set_scale(
@@ -58,7 +132,38 @@ class ObjectTransform:
             scale: Scale factors as (x, y, z).
         """
         obj.scale = scale
-        logger.debug(f"Set {obj.name} scale to {scale}")
+        logger.debug("Set %s scale to %s", obj.name, scale)
+    
+    @staticmethod
+    def random_rotations(
+        objs: List[bpy.types.Object],
+        x_range: Tuple[float, float] = (-np.pi, np.pi),
+        y_range: Tuple[float, float] = (-np.pi, np.pi),
+        z_range: Tuple[float, float] = (-np.pi, np.pi),
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        """Apply independent random rotations to several objects.
+        
+        All angles are drawn in a single call as an (N, 3) array. Without
+        an explicit generator they come from the global ``np.random``
+        state, so ``np.random.seed()`` keeps results reproducible.
+        
+        Args:
+            objs: Blender objects.
+            x_range: X rotation range in radians.
+            y_range: Y rotation range in radians.
+            z_range: Z rotation range in radians.
+            rng: Random generator. If None, uses ``np.random``.
+        """
+        if rng is None:
+            rng = np.random
+        
+        low = np.array([x_range[0], y_range[0], z_range[0]])
+        high = np.array([x_range[1], y_range[1], z_range[1]])
+        rotations = rng.uniform(low, high, size=(len(objs), 3))
+        
+        for obj, rotation in zip(objs, rotations.tolist()):
+            ObjectTransform.set_rotation(obj, tuple(rotation))
     
     @staticmethod
     def random_rotation(
@@ -66,6 +171,7 @@ class ObjectTransform:
         x_range: Tuple[float, float] = (-np.pi, np.pi),
         y_range: Tuple[float, float] = (-np.pi, np.pi),
         z_range: Tuple[float, float] = (-np.pi, np.pi),
+        rng: Optional[np.random.Generator] = None,
     ) -> None:
         """Apply random rotation to object.
         
@@ -74,9 +180,6 @@ class ObjectTransform:
             x_range: X rotation range in radians.
             y_range: Y rotation range in radians.
             z_range: Z rotation range in radians.
+            rng: Random generator. If None, uses ``np.random``.
         """
-        rx = np.random.uniform(*x_range)
-        ry = np.random.uniform(*y_range)
-        rz = np.random.uniform(*z_range)
-        
-        ObjectTransform.set_rotation(obj, (rx, ry, rz))
\ No newline at end of file
+        ObjectTransform.random_rotations([obj], x_range, y_range, z_range, rng=rng)
\ No newline at end of file
@@ -11,6 +11,7 @@ from nunalleq_synth.pipeline.config import (
     RandomizationConfig,
     AnnotationConfig,
     load_config,
+    peek_config,
     save_config,
 )
 from nunalleq_synth.pipeline.generator import SyntheticGenerator
@@ -23,6 +24,7 @@ __all__ = [
     "RandomizationConfig",
     "AnnotationConfig",
     "load_config",
+    "peek_config",
     "save_config",
     "SyntheticGenerator",
     "BatchProcessor",
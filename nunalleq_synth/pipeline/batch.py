@@ -4,17 +4,155 @@
 """Batch processing utilities."""
 
 import logging
+import multiprocessing
+import threading
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from tqdm import tqdm
 
+from nunalleq_synth.objects.loader import ModelCache
 from nunalleq_synth.pipeline.config import GenerationConfig, load_config
 from nunalleq_synth.pipeline.generator import SyntheticGenerator
+from nunalleq_synth.utils.io import iter_files
 
 logger = logging.getLogger(__name__)
 
+# Per-process model cache. Blender data cannot be shared between processes,
+# so each worker keeps its own cache for the lifetime of the pool.
+_worker_model_cache: Optional[ModelCache] = None
+
+
+def _get_worker_model_cache() -> ModelCache:
+    """Get the model cache of the current worker process.
+    
+    Returns:
+        Model cache, created on first use.
+    """
+    global _worker_model_cache
+    if _worker_model_cache is None:
+        _worker_model_cache = ModelCache()
+    return _worker_model_cache
+
+
+# Per-process generator state, set up by _init_worker()
+_worker_config: Optional[GenerationConfig] = None
+_worker_generator: Optional[SyntheticGenerator] = None
+
+
+def _init_worker(config_data: Dict[str, Any]) -> None:
+    """Initialize a batch worker process.
+    
+    Args:
+        config_data: Base generation configuration as a plain dict.
+    """
+    global _worker_config
+    _worker_config = GenerationConfig(**config_data)
+
+
+def _run_one(model_dir: Path, output_dir: Path) -> bool:
+    """Process one model directory in a batch worker.
+    
+    The first call builds a SyntheticGenerator; later calls retarget it,
+    so Blender setup is paid once per worker instead of once per
+    directory.
+    
+    Args:
+        model_dir: Directory containing models.
+        output_dir: Output directory.
+        
+    Returns:
+        True if successful, False otherwise.
+    """
+    global _worker_generator
+    
+    try:
+        cache = _get_worker_model_cache()
+        
+        if _worker_generator is None:
+            config = _worker_config.model_copy(deep=True)
+            config.model_dir = model_dir
+            config.output_dir = output_dir
+            _worker_generator = SyntheticGenerator(config, model_cache=cache)
+        else:
+            _worker_generator.retarget(model_dir, output_dir)
+        
+        _worker_generator.generate()
+        
+        logger.info(
+            f"Completed processing {model_dir} "
+            f"(model cache: {cache.hits} hits, {cache.misses} misses)"
+        )
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to process {model_dir}: {e}", exc_info=True)
+        return False
+
+
+class ModelPrefetcher(threading.Thread):
+    """Reads model files ahead of the workers that import them.
+    
+    Files are read and discarded so they are in the OS page cache by the
+    time a worker process imports them. At most ``lookahead`` directories
+    are prefetched beyond those reported done via release().
+    
+    Attributes:
+        model_dirs: Directories to prefetch, in processing order.
+        lookahead: Maximum number of directories read ahead.
+    """
+    
+    _CHUNK_SIZE = 1 << 20
+    
+    def __init__(self, model_dirs: List[Path], lookahead: int = 2) -> None:
+        """Initialize model prefetcher.
+        
+        Args:
+            model_dirs: Directories to prefetch, in processing order.
+            lookahead: Maximum number of directories read ahead.
+        """
+        super().__init__(name="ModelPrefetcher", daemon=True)
+        self.model_dirs = model_dirs
+        self.lookahead = lookahead
+        self._slots = threading.Semaphore(lookahead)
+        self._stop_event = threading.Event()
+    
+    def run(self) -> None:
+        """Prefetch directories until done or stopped."""
+        for model_dir in self.model_dirs:
+            self._slots.acquire()
+            if self._stop_event.is_set():
+                return
+            
+            # Order does not matter here, so stream files as they are found
+            for model_file in iter_files(model_dir, pattern="*.glb", recursive=True):
+                if self._stop_event.is_set():
+                    return
+                self._read(model_file)
+    
+    def _read(self, path: Path) -> None:
+        """Read a file and discard its contents.
+        
+        Args:
+            path: File to read.
+        """
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                while f.read(self._CHUNK_SIZE):
+                    pass
+        except OSError as e:
+            logger.debug("Prefetch of %s failed: %s", path, e)
+    
+    def release(self) -> None:
+        """Signal that a directory has been processed."""
+        self._slots.release()
+    
+    def stop(self) -> None:
+        """Stop prefetching."""
+        self._stop_event.set()
+        self._slots.release()
+
 
 class BatchProcessor:
     """Processes multiple model directories in batch.
@@ -22,21 +160,25 @@ class BatchProcessor:
     Attributes:
         config: Base generation configuration.
         num_workers: Number of parallel workers.
+        prefetch: Whether to read model files ahead of the workers.
     """
     
     def __init__(
         self,
         config: GenerationConfig,
         num_workers: int = 4,
+        prefetch: bool = True,
     ) -> None:
         """Initialize batch processor.
         
         Args:
             config: Base generation configuration.
             num_workers: Number of parallel workers.
+            prefetch: Whether to read model files ahead of the workers.
         """
         self.config = config
         self.num_workers = num_workers
+        self.prefetch = prefetch
         logger.info(f"BatchProcessor initialized with {num_workers} workers")
     
     def process_directory(
@@ -61,10 +203,14 @@ class BatchProcessor:
             config.output_dir = output_dir
             
             # Generate dataset
-            generator = SyntheticGenerator(config)
+            cache = _get_worker_model_cache()
+            generator = SyntheticGenerator(config, model_cache=cache)
             generator.generate()
             
-            logger.info(f"Completed processing {model_dir}")
+            logger.info(
+                f"Completed processing {model_dir} "
+                f"(model cache: {cache.hits} hits, {cache.misses} misses)"
+            )
             return True
             
         except Exception as e:
@@ -89,16 +235,30 @@ class BatchProcessor:
         
         success_count = 0
         
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+        # Drop duplicates and keep a stable order so each directory is
+        # handled by a single worker
+        model_dirs = sorted(set(model_dirs))
+        
+        # Keep the next directory warm while every worker is busy
+        prefetcher = None
+        if self.prefetch:
+            prefetcher = ModelPrefetcher(model_dirs, lookahead=self.num_workers + 1)
+            prefetcher.start()
+        
+        # Workers keep a warm generator across the directories they handle.
+        # Spawned workers start from a clean interpreter instead of a
+        # forked copy of this process's Blender state.
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config.model_dump(),),
+        ) as executor:
             futures = {}
             
             for model_dir in model_dirs:
                 output_dir = output_base / model_dir.name
-                future = executor.submit(
-                    self.process_directory,
-                    model_dir,
-                    output_dir,
-                )
+                future = executor.submit(_run_one, model_dir, output_dir)
                 futures[future] = model_dir
             
             # Process completed tasks
@@ -108,12 +268,18 @@ class BatchProcessor:
                 desc="Processing directories",
             ):
                 model_dir = futures[future]
+                if prefetcher is not None:
+                    prefetcher.release()
                 try:
                     if future.result():
                         success_count += 1
                 except Exception as e:
                     logger.error(f"Error processing {model_dir}: {e}")
         
+        if prefetcher is not None:
+            prefetcher.stop()
+            prefetcher.join()
+        
         logger.info(
             f"Batch processing complete: {success_count}/{len(model_dirs)} succeeded"
         )
@@ -1,20 +1,49 @@
 # nunalleq_synth/pipeline/config.py
 """Configuration management for synthetic data generation."""
 
+import functools
+import io
+import itertools
+import json
 import logging
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List  # FIXED: Import List from typing
+from typing import Callable, Literal, Type, TypeVar, get_args, get_origin
 
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Prefer the libyaml C bindings, which parse and emit far faster
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper
+    from yaml import SafeLoader as _YAMLLoader
+    
+    logger.warning(
+        "PyYAML was built without libyaml; config files are parsed by the "
+        "slower pure-Python loader. Install libyaml and reinstall PyYAML "
+        "to enable the C loader."
+    )
+
 
 class PhysicsConfig(BaseModel):
     """Physics simulation configuration."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     gravity: Tuple[float, float, float] = Field(
         default=(0.0, 0.0, -9.81),
         description="Gravity vector (x, y, z)",
@@ -41,20 +70,36 @@ class PhysicsConfig(BaseModel):
         le=1.0,
         description="Default bounciness",
     )
+    cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached simulation results (disabled if None)",
+    )
 
 
 class RenderConfig(BaseModel):
     """Rendering configuration."""
     
-    engine: str = Field(
+    model_config = ConfigDict(defer_build=True)
+    
+    engine: Literal["CYCLES", "EEVEE"] = Field(
         default="CYCLES",
         description="Render engine (CYCLES or EEVEE)",
     )
     samples: int = Field(
-        default=128,
+        default=64,
         ge=1,
         description="Number of render samples",
     )
+    adaptive_threshold: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Noise threshold for Cycles adaptive sampling (0 disables)",
+    )
+    denoiser: Optional[Literal["OPTIX", "OPENIMAGEDENOISE"]] = Field(
+        default="OPTIX",
+        description="Cycles denoiser (OPTIX or OPENIMAGEDENOISE), None to disable",
+    )
     use_gpu: bool = Field(
         default=True,
         description="Use GPU acceleration if available",
@@ -73,18 +118,13 @@ class RenderConfig(BaseModel):
         le=100,
         description="Image quality (for JPEG)",
     )
-    
-    @validator('engine')
-    def validate_engine(cls, v: str) -> str:
-        """Validate render engine."""
-        if v not in ['CYCLES', 'EEVEE']:
-            raise ValueError("engine must be 'CYCLES' or 'EEVEE'")
-        return v
 
 
 class RandomizationConfig(BaseModel):
     """Domain randomization configuration."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     lighting_intensity_range: Tuple[float, float] = Field(
         default=(500.0, 2000.0),
         description="Light intensity range (min, max)",
@@ -114,7 +154,9 @@ class RandomizationConfig(BaseModel):
 class AnnotationConfig(BaseModel):
     """Annotation configuration."""
     
-    format: str = Field(
+    model_config = ConfigDict(defer_build=True)
+    
+    format: Literal["yolo", "coco", "pascal_voc"] = Field(
         default="yolo",
         description="Annotation format (yolo, coco, pascal_voc)",
     )
@@ -133,18 +175,13 @@ class AnnotationConfig(BaseModel):
         default_factory=list,
         description="List of class names for objects",
     )
-    
-    @validator('format')
-    def validate_format(cls, v: str) -> str:
-        """Validate annotation format."""
-        if v not in ['yolo', 'coco', 'pascal_voc']:
-            raise ValueError("format must be 'yolo', 'coco', or 'pascal_voc'")
-        return v
 
 
 class GenerationConfig(BaseModel):
     """Main configuration for synthetic data generation."""
     
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+    
     # Paths
     model_dir: Path = Field(
         ...,
@@ -174,6 +211,11 @@ class GenerationConfig(BaseModel):
         default=None,
         description="Random seed for reproducibility",
     )
+    num_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of parallel Blender worker processes per split",
+    )
     
     # Sub-configurations
     physics: PhysicsConfig = Field(
@@ -193,23 +235,84 @@ class GenerationConfig(BaseModel):
         description="Annotation settings",
     )
     
-    @validator('train_test_val_split')
+    @field_validator('train_test_val_split')
+    @classmethod
     def validate_split(cls, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
         """Validate dataset split ratios sum to 1.0."""
-        if not abs(sum(v) - 1.0) < 1e-6:
+        if not math.isclose(sum(v), 1.0, rel_tol=0.0, abs_tol=1e-6):
             raise ValueError("train_test_val_split must sum to 1.0")
         return v
+
+
+def _trusted_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Get the function restoring a JSON-mode value of a field type.
+    
+    Args:
+        annotation: Field type annotation.
+        
+    Returns:
+        Converter, or None if values can be used as they are.
+    """
+    origin = get_origin(annotation)
+    if origin is tuple:
+        return tuple
+    if origin is not None and origin is not list:
+        # Optional[X]: convert non-None values as X
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _trusted_converter(args[0]) if len(args) == 1 else None
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
     
-    class Config:
-        """Pydantic configuration."""
-        arbitrary_types_allowed = True
+    if annotation is Path:
+        return Path
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return functools.partial(_construct_trusted, annotation)
+    return None
 
 
-def load_config(config_path: Path) -> GenerationConfig:
-    """Load configuration from YAML file.
+@functools.lru_cache(maxsize=None)
+def _trusted_plan(
+    model_cls: Type[BaseModel],
+) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+    """Get (field name, converter) pairs of a model, computed once per class."""
+    return tuple(
+        (name, _trusted_converter(field_info.annotation))
+        for name, field_info in model_cls.model_fields.items()
+    )
+
+
+def _construct_trusted(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Build a model and its sub-models with model_construct().
     
     Args:
-        config_path: Path to YAML configuration file.
+        model_cls: Model class to build.
+        data: Field values as written by save_config().
+        
+    Returns:
+        Model instance that has not been validated.
+    """
+    values = {}
+    for name, convert in _trusted_plan(model_cls):
+        if name in data:
+            value = data[name]
+            values[name] = value if convert is None else convert(value)
+    return model_cls.model_construct(**values)
+
+
+def load_config(config_path: Path, trusted: bool = False) -> GenerationConfig:
+    """Load configuration from YAML or JSON file.
+    
+    Files with a ``.json`` suffix are parsed as JSON, with orjson if it is
+    installed; anything else is parsed as YAML.
+    
+    With ``trusted=True`` the config is built with model_construct() and
+    skips all validation, including range checks and validate_split.
+    Only use it for files written by save_config().
+    
+    Args:
+        config_path: Path to YAML or JSON configuration file.
+        trusted: Whether to skip validation for a file known to be valid.
         
     Returns:
         GenerationConfig instance.
@@ -223,17 +326,74 @@ def load_config(config_path: Path) -> GenerationConfig:
     
     logger.info(f"Loading configuration from {config_path}")
     
-    with open(config_path, 'r') as f:
-        config_dict = yaml.safe_load(f)
+    if config_path.suffix.lower() == ".json":
+        data = config_path.read_bytes()
+        config_dict = orjson.loads(data) if orjson is not None else json.loads(data)
+    else:
+        with open(config_path, 'r') as f:
+            config_dict = yaml.load(f, Loader=_YAMLLoader)
     
-    config = GenerationConfig(**config_dict)
+    if trusted:
+        config = _construct_trusted(GenerationConfig, config_dict)
+    else:
+        config = GenerationConfig(**config_dict)
     logger.info("Configuration loaded successfully")
     
     return config
 
 
+def peek_config(
+    config_path: Path,
+    keys: Tuple[str, ...] = ("num_images", "train_test_val_split"),
+    max_lines: int = 32,
+) -> Dict[str, Any]:
+    """Read a few top-level values of a config file without loading all of it.
+    
+    Only the first ``max_lines`` lines of a YAML file are parsed, which is
+    enough for keys near the top such as those written first by
+    save_config(). If that fails or misses a key, the whole file is loaded
+    with load_config() instead, so defaults fill in keys the file omits.
+    
+    Args:
+        config_path: Path to YAML or JSON configuration file.
+        keys: Top-level keys to read.
+        max_lines: Maximum number of lines parsed in the fast path.
+        
+    Returns:
+        Dict with the value of each key.
+        
+    Raises:
+        FileNotFoundError: If config file doesn't exist.
+        ValueError: If the fallback finds the config invalid, including
+            empty or truncated files.
+    """
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+    
+    if config_path.suffix.lower() != ".json":
+        try:
+            with open(config_path, 'r') as f:
+                header = "".join(itertools.islice(f, max_lines))
+            values = yaml.load(io.StringIO(header), Loader=_YAMLLoader)
+            if isinstance(values, dict) and all(key in values for key in keys):
+                return {key: values[key] for key in keys}
+        except yaml.YAMLError:
+            pass
+        logger.debug("Header of %s is incomplete, loading full config", config_path)
+    
+    try:
+        values = load_config(config_path).model_dump(mode="json")
+    except (yaml.YAMLError, TypeError) as e:
+        # Malformed YAML, or a file that is empty or not a mapping
+        raise ValueError(f"Invalid config file {config_path}: {e}") from e
+    return {key: values[key] for key in keys}
+
+
 def save_config(config: GenerationConfig, output_path: Path) -> None:
-    """Save configuration to YAML file.
+    """Save configuration to YAML or JSON file.
+    
+    The format follows the file suffix as in load_config(), so JSON can be
+    used where configs are loaded repeatedly and YAML for hand editing.
     
     Args:
         config: Configuration to save.
@@ -241,9 +401,25 @@ def save_config(config: GenerationConfig, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    config_dict = config.dict()
+    # JSON mode turns paths and tuples into plain YAML-safe types
+    config_dict = config.model_dump(mode="json")
+    
+    if output_path.suffix.lower() == ".json":
+        if orjson is not None:
+            data = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config_dict, indent=2).encode()
+        output_path.write_bytes(data)
+        logger.info(f"Configuration saved to {output_path}")
+        return
     
     with open(output_path, 'w') as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config_dict,
+            f,
+            Dumper=_YAMLDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
     
     logger.info(f"Configuration saved to {output_path}")
\ No newline at end of file
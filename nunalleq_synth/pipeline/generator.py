@@ -5,10 +5,15 @@
 """Main synthetic data generation pipeline."""
 
 import logging
+import multiprocessing
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import bpy
 import numpy as np
 from tqdm import tqdm
 
@@ -16,17 +21,36 @@ from nunalleq_synth.core.scene import Scene
 from nunalleq_synth.core.physics import PhysicsSimulator
 from nunalleq_synth.core.renderer import Renderer
 from nunalleq_synth.core.camera import Camera
-from nunalleq_synth.objects.loader import ObjectLoader
-from nunalleq_synth.randomization.lighting import LightingRandomizer
+from nunalleq_synth.objects.loader import ModelCache, ObjectLoader
+from nunalleq_synth.randomization.lighting import LightingParams, LightingRandomizer
 from nunalleq_synth.randomization.camera import CameraRandomizer
 from nunalleq_synth.annotation.bbox import BoundingBoxCalculator
-from nunalleq_synth.annotation.yolo import YOLOAnnotator
-from nunalleq_synth.pipeline.config import GenerationConfig
-from nunalleq_synth.utils.io import ensure_dir, list_files
+from nunalleq_synth.annotation.yolo import YOLOAnnotator, write_label_files
+from nunalleq_synth.pipeline.config import GenerationConfig, peek_config
+from nunalleq_synth.utils.gpu import list_cuda_devices
+from nunalleq_synth.utils.io import ensure_dir, list_files_cached
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SceneParams:
+    """Random values for one scene, drawn together before it is built.
+    
+    Attributes:
+        num_objects: Number of objects to drop.
+        model_indices: Index into the model file list for each object.
+        scales: Uniform scale factor for each object.
+        drop_locations: (x, y, height) drop position for each object.
+        lighting: Lighting parameters.
+    """
+    num_objects: int
+    model_indices: np.ndarray
+    scales: np.ndarray
+    drop_locations: np.ndarray
+    lighting: LightingParams
+
+
 class SyntheticGenerator:
     """Main pipeline for generating synthetic training data.
     
@@ -36,34 +60,95 @@ class SyntheticGenerator:
         physics: Physics simulator.
         renderer: Image renderer.
         object_loader: 3D object loader.
+        model_cache: Cache of imported models used by the object loader.
         bbox_calculator: Bounding box calculator.
         annotator: Annotation writer.
+        rng: Random generator for scene, lighting and camera parameters.
     """
     
-    def __init__(self, config: GenerationConfig) -> None:
+    # Buffered label files written per background flush
+    _LABEL_FLUSH_SIZE = 512
+    
+    def __init__(
+        self,
+        config: GenerationConfig,
+        model_cache: Optional[ModelCache] = None,
+    ) -> None:
         """Initialize synthetic data generator.
         
         Args:
             config: Generation configuration.
+            model_cache: Optional model cache to reuse imported models across
+                generators. A new cache is created if not provided.
         """
         self.config = config
+        self.model_cache = model_cache if model_cache is not None else ModelCache()
+        self._base_class_names = list(config.annotation.class_names)
         
         # Set random seed
-        if config.random_seed is not None:
-            random.seed(config.random_seed)
-            np.random.seed(config.random_seed)
-            logger.info(f"Random seed set to {config.random_seed}")
+        self._seed()
         
         # Initialize components
         self._initialize_components()
         
         # Load models
-        self.model_files = self._discover_models()
-        logger.info(f"Found {len(self.model_files)} 3D models")
+        self._set_model_files(self._discover_models())
         
         # Setup output directories
         self._setup_output_dirs()
     
+    def _seed(self) -> None:
+        """Seed the random number generators from the configuration."""
+        # Each split spawns its own child sequence from this one
+        self._seed_sequence = np.random.SeedSequence(self.config.random_seed)
+        self.rng = np.random.default_rng(self.config.random_seed)
+        if self.config.random_seed is not None:
+            random.seed(self.config.random_seed)
+            np.random.seed(self.config.random_seed)
+            logger.info(f"Random seed set to {self.config.random_seed}")
+    
+    def retarget(self, model_dir: Path, output_dir: Path) -> None:
+        """Point the generator at a new model and output directory.
+        
+        Keeps the initialized Blender scene, renderer and model cache, so
+        several datasets can be generated without rebuilding them.
+        
+        Args:
+            model_dir: Directory containing 3D models.
+            output_dir: Output directory for the dataset.
+        """
+        self.config.model_dir = model_dir
+        self.config.output_dir = output_dir
+        
+        # Classes discovered for the previous directory do not carry over
+        self.config.annotation.class_names[:] = self._base_class_names
+        self._reset_class_index()
+        
+        self._seed()
+        self._teardown_scene()
+        
+        self._set_model_files(self._discover_models())
+        
+        self._setup_output_dirs()
+    
+    def _set_model_files(self, model_files: List[Path]) -> None:
+        """Store discovered models along with their class IDs.
+        
+        Class IDs are resolved once here, so placing objects only indexes
+        into a list, and every model is imported into the model cache up
+        front so scenes only instance cached meshes.
+        
+        Args:
+            model_files: Paths to .glb files.
+        """
+        self.model_files = model_files
+        self._models: List[Tuple[Path, int]] = [
+            (model_path, self._get_class_id(model_path)) for model_path in model_files
+        ]
+        logger.info(f"Found {len(self.model_files)} 3D models")
+        
+        self.object_loader.prewarm(model_files)
+    
     def _initialize_components(self) -> None:
         """Initialize all pipeline components."""
         logger.info("Initializing pipeline components...")
@@ -77,10 +162,14 @@ class SyntheticGenerator:
             gravity=self.config.physics.gravity,
             simulation_steps=self.config.physics.simulation_steps,
             substeps=self.config.physics.substeps,
+            cache_dir=self.config.physics.cache_dir,
         )
         
         self.renderer = Renderer(self.config.render)
-        self.object_loader = ObjectLoader()
+        self.object_loader = ObjectLoader(
+            cache=self.model_cache,
+            on_change=self.scene.invalidate_cache,
+        )
         
         self.lighting_randomizer = LightingRandomizer(
             self.config.randomization,
@@ -96,19 +185,32 @@ class SyntheticGenerator:
             class_names=self.config.annotation.class_names,
         )
         
+        # Scene objects kept resident between images
+        self._ground = None
+        self._lights: List[object] = []
+        self._object_pool: Dict[Path, List[object]] = {}
+        self._active_objects: List[Tuple[Path, object]] = []
+        self._rest_rotations: Dict[str, Tuple[float, float, float]] = {}
+        
+        # (label path, contents) pairs awaiting a write; None writes each
+        # label as soon as its image is done
+        self._label_buffer: Optional[List[Tuple[str, bytes]]] = None
+        self._label_writer: Optional[ThreadPoolExecutor] = None
+        
+        self._reset_class_index()
+        
         logger.info("Pipeline components initialized")
     
     def _discover_models(self) -> List[Path]:
         """Discover 3D models in model directory.
         
+        The listing is cached on disk, so large model directories are
+        only walked again after they change.
+        
         Returns:
             List of paths to .glb files.
         """
-        model_files = list_files(
-            self.config.model_dir,
-            pattern="*.glb",
-            recursive=True,
-        )
+        model_files = list_files_cached(self.config.model_dir, pattern="*.glb")
         
         if not model_files:
             logger.warning(f"No .glb files found in {self.config.model_dir}")
@@ -144,55 +246,143 @@ class SyntheticGenerator:
         
         return train_count, test_count, val_count
     
-    def _setup_scene(self) -> None:
-        """Setup basic scene with ground plane and lighting."""
-        # Clear scene
-        self.scene.clear()
-        
-        # Add ground plane
-        ground = self.scene.add_plane(size=10.0, location=(0, 0, 0), name="Ground")
-        self.physics.add_rigid_body(
-            ground,
-            body_type="PASSIVE",
-            friction=self.config.physics.friction,
+    def _draw_scene_params(self, num_objects_max: int) -> SceneParams:
+        """Draw all random values for one scene in a few vectorized calls.
+        
+        Args:
+            num_objects_max: Maximum number of objects to drop.
+            
+        Returns:
+            Scene parameters.
+        """
+        rng = self.rng
+        num_objects = int(rng.integers(1, num_objects_max + 1))
+        
+        return SceneParams(
+            num_objects=num_objects,
+            model_indices=rng.integers(0, len(self._models), size=num_objects),
+            scales=rng.uniform(
+                *self.config.randomization.object_scale_range, size=num_objects
+            ),
+            drop_locations=rng.uniform(
+                (-2.0, -2.0, 0.5),
+                (2.0, 2.0, 2.0),
+                size=(num_objects, 3),
+            ),
+            lighting=self.lighting_randomizer.sample_params(rng),
+        )
+    
+    def _ensure_scene(self, params: SceneParams) -> None:
+        """Make sure the ground plane exists and randomize the lighting.
+        
+        The ground plane, background and lights are created on the first
+        call only. Later calls just reconfigure the existing lights.
+        
+        Args:
+            params: Scene parameters.
+        """
+        if self._ground is None:
+            # Add ground plane
+            self._ground = self.scene.add_plane(
+                size=10.0,
+                location=(0, 0, 0),
+                name="Ground",
+            )
+            self.physics.add_rigid_body(
+                self._ground,
+                body_type="PASSIVE",
+                friction=self.config.physics.friction,
+                collision_shape='BOX',
+            )
+            
+            # Set background
+            self.scene.set_background_color((1.0, 1.0, 1.0, 1.0))
+        
+        # Randomize lighting, reusing the lights of the previous image
+        self._lights = self.lighting_randomizer.randomize_scene_lighting(
+            self.scene,
+            params.lighting,
+            lights=self._lights,
         )
+    
+    def _acquire_object(self, model_path: Path, scale: float) -> Optional[object]:
+        """Get an object for a model, from the pool if one is parked.
         
-        # Add randomized lighting
-        self.lighting_randomizer.randomize_scene_lighting(self.scene)
+        Args:
+            model_path: Path to model file.
+            scale: Uniform scale factor.
+            
+        Returns:
+            Object, or None if loading failed.
+        """
+        pool = self._object_pool.get(model_path)
+        if pool:
+            obj = pool.pop()
+            obj.scale = (scale, scale, scale)
+            obj.hide_render = False
+        else:
+            obj = self.object_loader.load_glb(model_path, scale=scale)
+            if obj is None:
+                return None
+            self._rest_rotations[obj.name_full] = tuple(obj.rotation_euler)
         
-        # Set background
-        self.scene.set_background_color((1.0, 1.0, 1.0, 1.0))
+        self._active_objects.append((model_path, obj))
+        return obj
     
-    def _place_objects(self) -> List[Tuple[object, int]]:
+    def _release_objects(self) -> None:
+        """Hide and park the objects of the current image for reuse."""
+        for model_path, obj in self._active_objects:
+            obj.hide_render = True
+            obj.rotation_euler = self._rest_rotations[obj.name_full]
+            self.physics.park_object(obj)
+            self._object_pool.setdefault(model_path, []).append(obj)
+        self._active_objects.clear()
+    
+    def _teardown_scene(self) -> None:
+        """Delete the ground plane, lights and pooled objects."""
+        self._active_objects.clear()
+        self._object_pool.clear()
+        self._rest_rotations.clear()
+        self.object_loader.clear_all()
+        self.bbox_calculator.clear_cache()
+        
+        resident = [self._ground] if self._ground is not None else []
+        self.scene.remove_objects(resident + self._lights)
+        self._ground = None
+        self._lights = []
+        
+        self.physics.clear_simulation()
+    
+    def _place_objects(self, params: SceneParams) -> List[Tuple[object, int]]:
         """Place random objects in scene using physics.
         
+        Args:
+            params: Scene parameters.
+            
         Returns:
             List of (object, class_id) tuples.
         """
-        num_objects = random.randint(1, self.config.max_objects_per_scene)
         placed_objects = []
         
-        for _ in range(num_objects):
-            # Select random model
-            model_path = random.choice(self.model_files)
-            class_id = self._get_class_id(model_path)
-            
-            # Load object
-            obj = self.object_loader.load_glb(
-                model_path,
-                scale=random.uniform(*self.config.randomization.object_scale_range),
-            )
-            
-            if obj is None:
-                continue
-            
-            # Drop object from random position
-            x = random.uniform(-2.0, 2.0)
-            y = random.uniform(-2.0, 2.0)
-            height = random.uniform(0.5, 2.0)
-            
-            self.physics.drop_object(obj, height=height, location=(x, y))
-            placed_objects.append((obj, class_id))
+        # Rigid bodies for all dropped objects are added in one sweep
+        with self.physics.batch():
+            for model_index, scale, (x, y, height) in zip(
+                params.model_indices.tolist(),
+                params.scales.tolist(),
+                params.drop_locations.tolist(),
+            ):
+                # Selected model and its precomputed class ID
+                model_path, class_id = self._models[model_index]
+                
+                # Load object, or reuse a parked one
+                obj = self._acquire_object(model_path, scale)
+                
+                if obj is None:
+                    continue
+                
+                # Drop object from its drawn position
+                self.physics.drop_object(obj, height=height, location=(x, y))
+                placed_objects.append((obj, class_id))
         
         # Run physics simulation
         self.physics.simulate()
@@ -212,79 +402,112 @@ class SyntheticGenerator:
         # e.g., models/ulus/model.glb -> "ulus"
         class_name = model_path.parent.name
         
-        if class_name in self.config.annotation.class_names:
-            return self.config.annotation.class_names.index(class_name)
-        else:
+        class_id = self._class_id.get(class_name)
+        if class_id is None:
             # Add new class if not in list
-            self.config.annotation.class_names.append(class_name)
-            logger.debug(f"Added new class: {class_name}")
-            return len(self.config.annotation.class_names) - 1
+            class_names = self.config.annotation.class_names
+            class_names.append(class_name)
+            class_id = len(class_names) - 1
+            self._class_id[class_name] = class_id
+            logger.debug("Added new class: %s", class_name)
+        
+        return class_id
+    
+    def _reset_class_index(self) -> None:
+        """Rebuild the class name to ID index from the configured names."""
+        self._class_id: Dict[str, int] = {}
+        for class_id, class_name in enumerate(self.config.annotation.class_names):
+            # Keep the first ID of a repeated name, as list.index() would
+            self._class_id.setdefault(class_name, class_id)
     
     def generate_single_image(
         self,
-        output_path: Path,
-        annotation_path: Path,
+        output_path: Union[str, Path],
+        annotation_path: Union[str, Path],
+        camera_pose: Optional[Tuple[np.ndarray, float]] = None,
     ) -> bool:
         """Generate a single synthetic image with annotations.
         
         Args:
             output_path: Path to save rendered image.
             annotation_path: Path to save annotations.
+            camera_pose: Precomputed (location, focal_length) from
+                CameraRandomizer.sample_poses(). If None, a pose is drawn.
             
         Returns:
             True if successful, False otherwise.
         """
         try:
+            # Draw all random values for this scene up front
+            params = self._draw_scene_params(self.config.max_objects_per_scene)
+            
             # Setup scene
-            self._setup_scene()
+            self._ensure_scene(params)
             
             # Place objects
-            placed_objects = self._place_objects()
+            placed_objects = self._place_objects(params)
             
             if not placed_objects:
                 logger.warning("No objects placed, skipping image")
                 return False
             
             # Randomize camera
-            self.camera_randomizer.randomize_camera(self.scene.camera)
+            if camera_pose is not None:
+                self.camera_randomizer.apply_pose(self.scene.camera, *camera_pose)
+            else:
+                self.camera_randomizer.randomize_camera(self.scene.camera)
+            
+            # Evaluate the new camera pose; matrix_world keeps the previous
+            # image's transform until the depsgraph is updated
+            bpy.context.view_layer.update()
+            
+            # Calculate bounding boxes for all objects in one pass. They only
+            # depend on the scene, so they are known before rendering and
+            # images without a valid box are never rendered.
+            objects, class_ids = zip(*placed_objects)
+            annotations = self.bbox_calculator.calculate_bboxes_batch(
+                objects,
+                self.scene.camera,
+                self.config.render.resolution,
+                class_ids=class_ids,
+            )
+            annotations = annotations.select(
+                annotations.area >= self.config.annotation.min_bbox_area
+            )
+            
+            if not len(annotations):
+                logger.warning("No valid annotations, skipping image")
+                return False
             
             # Render image
-            self.renderer.render(output_path)
+            if not self.renderer.render(output_path):
+                return False
             
-            # Calculate bounding boxes
-            annotations = []
-            for obj, class_id in placed_objects:
-                bbox = self.bbox_calculator.calculate_bbox(
-                    obj,
-                    self.scene.camera,
-                    self.config.render.resolution,
+            # Save annotations, or hold them for the next flush
+            if self._label_buffer is not None:
+                self._label_buffer.append(
+                    (
+                        os.fspath(annotation_path),
+                        self.annotator.format_annotations(annotations),
+                    )
                 )
-                
-                if bbox is not None:
-                    # Check minimum visibility
-                    if bbox.area >= self.config.annotation.min_bbox_area:
-                        annotations.append((class_id, bbox))
-            
-            # Save annotations
-            if annotations:
+            else:
                 self.annotator.save_annotations(
                     annotations,
                     annotation_path,
                     self.config.render.resolution,
                 )
-            else:
-                logger.warning("No valid annotations, skipping image")
-                return False
-            
-            # Cleanup
-            self.object_loader.clear_all()
-            self.physics.clear_simulation()
             
             return True
             
         except Exception as e:
             logger.error(f"Failed to generate image: {e}", exc_info=True)
             return False
+        
+        finally:
+            # Keep objects for the next image instead of deleting them
+            self._release_objects()
+            self.physics.clear_simulation()
     
     def generate_split(
         self,
@@ -302,17 +525,62 @@ class SyntheticGenerator:
         """
         logger.info(f"Generating {num_images} images for {split} split")
         
-        images_dir = self.config.output_dir / split / 'images'
-        labels_dir = self.config.output_dir / split / 'labels'
-        
-        success_count = 0
+        # Build every output path up front as plain strings, which is much
+        # cheaper per image than Path arithmetic
+        split_dir = os.path.join(os.fspath(self.config.output_dir), split)
+        images_dir = os.path.join(split_dir, 'images')
+        labels_dir = os.path.join(split_dir, 'labels')
+        image_paths = [
+            os.path.join(images_dir, f"{split}_{i:06d}.jpg") for i in range(num_images)
+        ]
+        label_paths = [
+            os.path.join(labels_dir, f"{split}_{i:06d}.txt") for i in range(num_images)
+        ]
+        
+        # One seed per image, so the result does not depend on num_workers
+        pose_seed, *image_seeds = self._seed_sequence.spawn(1)[0].spawn(num_images + 1)
+        
+        # Draw all camera poses for the split in one vectorized pass
+        locations, focal_lengths = self.camera_randomizer.sample_poses(
+            num_images,
+            rng=np.random.default_rng(pose_seed),
+        )
         
-        for i in tqdm(range(num_images), desc=f"Generating {split}"):
-            image_path = images_dir / f"{split}_{i:06d}.jpg"
-            label_path = labels_dir / f"{split}_{i:06d}.txt"
-            
-            if self.generate_single_image(image_path, label_path):
-                success_count += 1
+        tasks = [
+            (
+                image_paths[i],
+                label_paths[i],
+                image_seeds[i],
+                (locations[i], focal_lengths[i]),
+            )
+            for i in range(num_images)
+        ]
+        
+        # Labels are buffered and written by a background thread, so label
+        # I/O overlaps with rendering
+        self._label_buffer = []
+        self._label_writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="LabelWriter",
+        )
+        try:
+            if self.config.num_workers > 1 and num_images > 1:
+                success_count = self._generate_parallel(split, tasks)
+            else:
+                success_count = 0
+                for image_path, label_path, seed, camera_pose in tqdm(
+                    tasks,
+                    desc=f"Generating {split}",
+                ):
+                    self.rng = np.random.default_rng(seed)
+                    if self.generate_single_image(image_path, label_path, camera_pose):
+                        success_count += 1
+                    self._flush_labels()
+        finally:
+            self._flush_labels(force=True)
+            self._label_writer.shutdown(wait=True)
+            self._label_writer = None
+            self._label_buffer = None
         
         logger.info(
             f"Generated {success_count}/{num_images} images for {split} split"
@@ -320,10 +588,77 @@ class SyntheticGenerator:
         
         return success_count
     
+    def _generate_parallel(self, split: str, tasks: List[Tuple[Any, ...]]) -> int:
+        """Render the images of a split in a pool of worker processes.
+        
+        Each worker builds its own generator from this configuration and
+        is pinned to one CUDA device, assigned round-robin.
+        
+        Args:
+            split: Split name, for the progress bar.
+            tasks: (image_path, label_path, seed, camera_pose) per image.
+            
+        Returns:
+            Number of successfully generated images.
+        """
+        num_workers = min(self.config.num_workers, len(tasks))
+        devices = list_cuda_devices()
+        
+        # Blender cannot be forked safely
+        ctx = multiprocessing.get_context("spawn")
+        device_queue = ctx.Queue()
+        for worker_index in range(num_workers):
+            device_queue.put(devices[worker_index % len(devices)] if devices else None)
+        
+        success_count = 0
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=ctx,
+            initializer=_init_split_worker,
+            initargs=(self.config.model_dump(), device_queue),
+        ) as executor:
+            futures = [executor.submit(_generate_one, *task) for task in tasks]
+            
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc=f"Generating {split}",
+            ):
+                try:
+                    success, labels = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed to generate image: {e}")
+                    continue
+                
+                if success:
+                    success_count += 1
+                self._label_buffer.extend(labels)
+                self._flush_labels()
+        
+        return success_count
+    
+    def _flush_labels(self, force: bool = False) -> None:
+        """Hand buffered labels to the background writer.
+        
+        Args:
+            force: Flush even if fewer than _LABEL_FLUSH_SIZE labels are
+                buffered, e.g. at the end of a split.
+        """
+        if not self._label_buffer:
+            return
+        if not force and len(self._label_buffer) < self._LABEL_FLUSH_SIZE:
+            return
+        
+        labels, self._label_buffer = self._label_buffer, []
+        self._label_writer.submit(write_label_files, labels)
+    
     def generate(self) -> None:
         """Generate complete synthetic dataset."""
         logger.info("Starting synthetic dataset generation")
         
+        config_path = self.config.output_dir / 'config.yaml'
+        self._check_existing_dataset(config_path)
+        
         # Get split counts
         train_count, test_count, val_count = self._get_split_counts()
         
@@ -332,8 +667,10 @@ class SyntheticGenerator:
         self.generate_split('test', test_count)
         self.generate_split('val', val_count)
         
+        # Objects were kept resident between images; delete them now
+        self._teardown_scene()
+        
         # Save configuration
-        config_path = self.config.output_dir / 'config.yaml'
         from nunalleq_synth.pipeline.config import save_config
         save_config(self.config, config_path)
         
@@ -343,4 +680,80 @@ class SyntheticGenerator:
             for class_name in self.config.annotation.class_names:
                 f.write(f"{class_name}\n")
         
-        logger.info(f"Dataset generation complete: {self.config.output_dir}")
\ No newline at end of file
+        logger.info(f"Dataset generation complete: {self.config.output_dir}")
+    
+    def _check_existing_dataset(self, config_path: Path) -> None:
+        """Warn if the output directory holds a dataset with other settings.
+        
+        Only the header of the existing config is read, see peek_config().
+        
+        Args:
+            config_path: Config file of a previous run in the output directory.
+        """
+        if not config_path.exists():
+            return
+        
+        try:
+            existing = peek_config(config_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable config {config_path}: {e}")
+            return
+        
+        current = self.config.model_dump(mode="json", include=set(existing))
+        changed = [key for key, value in existing.items() if current[key] != value]
+        if changed:
+            logger.warning(
+                f"Existing dataset in {self.config.output_dir} was generated with "
+                f"different {', '.join(changed)}; its files will be overwritten"
+            )
+
+
+# Per-process generator for parallel split generation, set up by
+# _init_split_worker()
+_split_worker: Optional[SyntheticGenerator] = None
+
+
+def _init_split_worker(
+    config_data: Dict[str, Any],
+    device_queue: "multiprocessing.Queue",
+) -> None:
+    """Initialize a split worker process.
+    
+    Args:
+        config_data: Generation configuration as a plain dict.
+        device_queue: Queue holding one CUDA device ID (or None) per worker.
+    """
+    global _split_worker
+    
+    device = device_queue.get()
+    if device is not None:
+        # Must be set before Cycles initializes CUDA
+        os.environ["CUDA_VISIBLE_DEVICES"] = device
+    
+    _split_worker = SyntheticGenerator(GenerationConfig(**config_data))
+
+
+def _generate_one(
+    image_path: str,
+    label_path: str,
+    seed: np.random.SeedSequence,
+    camera_pose: Tuple[np.ndarray, float],
+) -> Tuple[bool, List[Tuple[str, bytes]]]:
+    """Generate one image in a split worker.
+    
+    The label file is not written here but returned, so the parent can
+    buffer and write labels for the whole split.
+    
+    Args:
+        image_path: Path to save rendered image.
+        label_path: Path to save annotations.
+        seed: Seed for this image's random values.
+        camera_pose: Precomputed (location, focal_length).
+        
+    Returns:
+        Tuple of (success, (label path, contents) pairs to write).
+    """
+    _split_worker.rng = np.random.default_rng(seed)
+    _split_worker._label_buffer = []
+    success = _split_worker.generate_single_image(image_path, label_path, camera_pose)
+    return success, _split_worker._label_buffer
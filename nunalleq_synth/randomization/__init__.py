@@ -3,11 +3,12 @@
 # ============================================================================
 """Domain randomization for synthetic data generation."""
 
-from nunalleq_synth.randomization.lighting import LightingRandomizer
+from nunalleq_synth.randomization.lighting import LightingParams, LightingRandomizer
 from nunalleq_synth.randomization.camera import CameraRandomizer
 from nunalleq_synth.randomization.environment import EnvironmentRandomizer
 
 __all__ = [
+    "LightingParams",
     "LightingRandomizer",
     "CameraRandomizer",
     "EnvironmentRandomizer",
@@ -4,8 +4,9 @@
 """Camera randomization."""
 
 import logging
+import math
 import random
-from typing import Tuple  # FIXED: Import Tuple from typing
+from typing import Optional, Tuple  # FIXED: Import Tuple from typing
 
 import numpy as np
 
@@ -45,31 +46,92 @@ class CameraRandomizer:
         # Random distance from focus point
         distance = random.uniform(*self.config.camera_distance_range)
         
-        # Random spherical coordinates
-        azimuth = random.uniform(0, 2 * np.pi)
+        # Random spherical coordinates (scalar math avoids ufunc dispatch)
+        azimuth = random.uniform(0, 2 * math.pi)
         
         # Convert angle range from degrees to radians
-        angle_min = np.radians(self.config.camera_angle_range[0])
-        angle_max = np.radians(self.config.camera_angle_range[1])
+        angle_min = math.radians(self.config.camera_angle_range[0])
+        angle_max = math.radians(self.config.camera_angle_range[1])
         elevation = random.uniform(
-            np.pi / 4 + angle_min,
-            np.pi / 4 + angle_max,
+            math.pi / 4 + angle_min,
+            math.pi / 4 + angle_max,
         )
         
         # Convert to Cartesian coordinates
-        x = focus_point[0] + distance * np.cos(azimuth) * np.sin(elevation)
-        y = focus_point[1] + distance * np.sin(azimuth) * np.sin(elevation)
-        z = focus_point[2] + distance * np.cos(elevation)
-        
-        # Set camera position
-        camera.set_location((x, y, z))
-        
-        # Point camera at focus point
-        camera.look_at(focus_point)
+        sin_elevation = math.sin(elevation)
+        x = focus_point[0] + distance * math.cos(azimuth) * sin_elevation
+        y = focus_point[1] + distance * math.sin(azimuth) * sin_elevation
+        z = focus_point[2] + distance * math.cos(elevation)
         
         # Random focal length variation
         base_focal_length = 50.0
         focal_variation = random.uniform(-10.0, 10.0)
-        camera.set_focal_length(base_focal_length + focal_variation)
         
-        logger.debug(f"Camera randomized: distance={distance:.2f}, azimuth={azimuth:.2f}")
\ No newline at end of file
+        self.apply_pose(
+            camera,
+            (x, y, z),
+            base_focal_length + focal_variation,
+            focus_point,
+        )
+        
+        logger.debug("Camera randomized: distance=%.2f, azimuth=%.2f", distance, azimuth)
+    
+    def sample_poses(
+        self,
+        num_poses: int,
+        focus_point: Tuple[float, float, float] = (0.0, 0.0, 0.5),
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw random camera poses for many images at once.
+        
+        Uses the same distributions as randomize_camera().
+        
+        Args:
+            num_poses: Number of poses to draw.
+            focus_point: Point to focus on (x, y, z).
+            rng: Random generator. If None, uses the global NumPy state.
+            
+        Returns:
+            Tuple of (locations, focal_lengths) with shapes (N, 3) and (N,).
+        """
+        rng = np.random if rng is None else rng
+        
+        distance = rng.uniform(*self.config.camera_distance_range, size=num_poses)
+        azimuth = rng.uniform(0, 2 * np.pi, size=num_poses)
+        
+        angle_min, angle_max = np.radians(self.config.camera_angle_range)
+        elevation = rng.uniform(
+            np.pi / 4 + angle_min,
+            np.pi / 4 + angle_max,
+            size=num_poses,
+        )
+        
+        sin_elevation = np.sin(elevation)
+        locations = np.empty((num_poses, 3))
+        locations[:, 0] = distance * np.cos(azimuth) * sin_elevation
+        locations[:, 1] = distance * np.sin(azimuth) * sin_elevation
+        locations[:, 2] = distance * np.cos(elevation)
+        locations += focus_point
+        
+        focal_lengths = 50.0 + rng.uniform(-10.0, 10.0, size=num_poses)
+        
+        return locations, focal_lengths
+    
+    def apply_pose(
+        self,
+        camera: Camera,
+        location: Tuple[float, float, float],
+        focal_length: float,
+        focus_point: Tuple[float, float, float] = (0.0, 0.0, 0.5),
+    ) -> None:
+        """Place camera at a pose and point it at the focus point.
+        
+        Args:
+            camera: Camera to move.
+            location: Camera location (x, y, z).
+            focal_length: Focal length in mm.
+            focus_point: Point to focus on (x, y, z).
+        """
+        camera.set_location(tuple(location))
+        camera.look_at(focus_point)
+        camera.set_focal_length(float(focal_length))
\ No newline at end of file
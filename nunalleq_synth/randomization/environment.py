@@ -48,5 +48,5 @@ class EnvironmentRandomizer:
         b = brightness * random.uniform(0.95, 1.0)
         
         scene.set_background_color((r, g, b, 1.0))
-        logger.debug(f"Background color set to ({r:.2f}, {g:.2f}, {b:.2f})")
+        logger.debug("Background color set to (%.2f, %.2f, %.2f)", r, g, b)
 
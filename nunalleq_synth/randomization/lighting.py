@@ -4,8 +4,8 @@
 """Lighting randomization."""
 
 import logging
-import random
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
 
 import bpy
 import numpy as np
@@ -15,6 +15,53 @@ from nunalleq_synth.pipeline.config import RandomizationConfig
 
 logger = logging.getLogger(__name__)
 
+# Number of entries in the Kelvin to RGB lookup table
+_KELVIN_LUT_SIZE = 512
+
+_LIGHT_TYPES = ('POINT', 'SUN', 'AREA')
+
+
+def _integers(
+    rng: Any,
+    low: int,
+    high: int,
+    size: Optional[int] = None,
+) -> Union[int, np.ndarray]:
+    """Draw integers in [low, high) from a Generator or the np.random module.
+    
+    Args:
+        rng: np.random.Generator, or the np.random module itself.
+        low: Lowest value, inclusive.
+        high: Highest value, exclusive.
+        size: Number of values, or None for a single one.
+        
+    Returns:
+        Integer or array of integers.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng.integers(low, high, size=size)
+    return rng.randint(low, high, size=size)
+
+
+@dataclass
+class LightingParams:
+    """Random values for the lights of one scene, one entry per light.
+    
+    Attributes:
+        light_types: Light types ('POINT', 'SUN' or 'AREA').
+        intensities: Light energies.
+        distances: Distances from the origin.
+        angles: Azimuth angles in radians.
+        elevations: Angles from the vertical axis in radians.
+        temperatures: Color temperatures in Kelvin.
+    """
+    light_types: List[str]
+    intensities: np.ndarray
+    distances: np.ndarray
+    angles: np.ndarray
+    elevations: np.ndarray
+    temperatures: np.ndarray
+
 
 class LightingRandomizer:
     """Randomizes scene lighting.
@@ -30,54 +77,138 @@ class LightingRandomizer:
             config: Randomization configuration.
         """
         self.config = config
+        self._kelvin_range = tuple(config.lighting_color_temp_range)
+        self._kelvin_lut = self._build_kelvin_lut(*self._kelvin_range)
         logger.debug("LightingRandomizer initialized")
     
-    def randomize_scene_lighting(self, scene: Scene) -> None:
-        """Add randomized lights to scene.
+    @staticmethod
+    def _build_kelvin_lut(
+        min_temperature: float,
+        max_temperature: float,
+    ) -> np.ndarray:
+        """Tabulate the Kelvin to RGB mapping over a temperature range.
         
         Args:
-            scene: Scene to add lights to.
+            min_temperature: Lowest temperature in Kelvin.
+            max_temperature: Highest temperature in Kelvin.
+            
+        Returns:
+            Array of shape (_KELVIN_LUT_SIZE, 3) with RGB colors for evenly
+            spaced temperatures from min to max.
         """
-        num_lights = random.randint(2, 4)
+        temperature = np.linspace(min_temperature, max_temperature, _KELVIN_LUT_SIZE)
         
-        for i in range(num_lights):
-            # Random light type
-            light_type = random.choice(['POINT', 'SUN', 'AREA'])
-            
-            # Random intensity
-            intensity = random.uniform(
-                *self.config.lighting_intensity_range
-            )
-            
-            # Random position
-            if light_type == 'SUN':
-                # Sun lights should be far away
-                distance = 10.0
-            else:
-                distance = random.uniform(2.0, 5.0)
-            
-            angle = random.uniform(0, 2 * np.pi)
-            elevation = random.uniform(np.pi / 6, np.pi / 3)
-            
-            x = distance * np.cos(angle) * np.sin(elevation)
-            y = distance * np.sin(angle) * np.sin(elevation)
-            z = distance * np.cos(elevation)
+        # Convert Kelvin to RGB (simplified)
+        warm = temperature <= 6500
+        cool_red = np.minimum(1.0, 1.0 - (temperature - 6500) / 3500)
+        warm_green = np.minimum(1.0, (temperature - 3000) / 3500)
+        warm_blue = np.clip((temperature - 4000) / 2500, 0.0, 1.0)
+        
+        lut = np.empty((_KELVIN_LUT_SIZE, 3))
+        lut[:, 0] = np.where(warm, 1.0, cool_red)
+        lut[:, 1] = np.where(warm, warm_green, 1.0)
+        lut[:, 2] = np.where(warm, warm_blue, 1.0)
+        
+        return lut
+    
+    def sample_params(
+        self,
+        rng: Optional[np.random.Generator] = None,
+    ) -> LightingParams:
+        """Draw the random values for one scene's lights at once.
+        
+        Args:
+            rng: Random generator. If None, uses the global ``np.random``
+                state, so ``np.random.seed()`` keeps results reproducible.
             
-            location = (x, y, z)
+        Returns:
+            Lighting parameters for randomize_scene_lighting().
+        """
+        rng = np.random if rng is None else rng
+        num_lights = int(_integers(rng, 2, 5))
+        
+        type_indices = _integers(rng, 0, len(_LIGHT_TYPES), size=num_lights)
+        
+        # Sun lights should be far away
+        distances = rng.uniform(2.0, 5.0, size=num_lights)
+        distances[type_indices == _LIGHT_TYPES.index('SUN')] = 10.0
+        
+        return LightingParams(
+            light_types=[_LIGHT_TYPES[i] for i in type_indices],
+            intensities=rng.uniform(
+                *self.config.lighting_intensity_range, size=num_lights
+            ),
+            distances=distances,
+            angles=rng.uniform(0, 2 * np.pi, size=num_lights),
+            elevations=rng.uniform(np.pi / 6, np.pi / 3, size=num_lights),
+            temperatures=rng.uniform(
+                *self.config.lighting_color_temp_range, size=num_lights
+            ),
+        )
+    
+    def randomize_scene_lighting(
+        self,
+        scene: Scene,
+        params: Optional[LightingParams] = None,
+        lights: Optional[List[bpy.types.Object]] = None,
+    ) -> List[bpy.types.Object]:
+        """Add randomized lights to scene.
+        
+        Existing light objects can be passed in to be reconfigured instead
+        of creating new ones. Only missing lights are added, and lights
+        beyond the drawn count are hidden from rendering.
+        
+        Args:
+            scene: Scene to add lights to.
+            params: Pre-drawn lighting parameters. If None, they are drawn
+                with sample_params().
+            lights: Light objects from an earlier call to reuse.
             
-            # Add light
-            light = scene.add_light(
-                light_type=light_type,
-                energy=intensity,
-                location=location,
-                name=f"Light_{i}",
+        Returns:
+            All light objects, in use first, for reuse in the next call.
+        """
+        if params is None:
+            params = self.sample_params()
+        lights = list(lights) if lights is not None else []
+        
+        # Positions on the upper hemisphere, computed for all lights at once
+        sin_elevation = np.sin(params.elevations)
+        locations = np.column_stack((
+            params.distances * np.cos(params.angles) * sin_elevation,
+            params.distances * np.sin(params.angles) * sin_elevation,
+            params.distances * np.cos(params.elevations),
+        ))
+        
+        specs = [
+            {
+                "light_type": light_type,
+                "energy": float(intensity),
+                "location": tuple(location.tolist()),
+                "name": f"Light_{i}",
+            }
+            for i, (light_type, intensity, location) in enumerate(
+                zip(params.light_types, params.intensities, locations)
             )
-            
-            # Random color temperature
-            temp = random.uniform(*self.config.lighting_color_temp_range)
+        ]
+        
+        # Reconfigure existing lights, then add the missing ones in one batch
+        for light, spec in zip(lights, specs):
+            light.data.type = spec["light_type"]
+            light.data.energy = spec["energy"]
+            light.location = spec["location"]
+            light.hide_render = False
+        
+        if len(specs) > len(lights):
+            lights.extend(scene.add_lights(specs[len(lights):]))
+        
+        for light in lights[len(specs):]:
+            light.hide_render = True
+        
+        for light, temp in zip(lights, params.temperatures):
             self._set_color_temperature(light, temp)
         
-        logger.debug(f"Added {num_lights} randomized lights")
+        logger.debug("Set up %s randomized lights", len(specs))
+        return lights
     
     def _set_color_temperature(
         self,
@@ -90,15 +221,14 @@ class LightingRandomizer:
             light: Light object.
             temperature: Color temperature in Kelvin (3000-6500).
         """
-        # Convert Kelvin to RGB (simplified)
-        if temperature <= 6500:
-            r = 1.0
-            g = min(1.0, (temperature - 3000) / 3500)
-            b = max(0.0, min(1.0, (temperature - 4000) / 2500))
+        # Nearest entry of the lookup table, clamped to the configured range
+        min_temperature, max_temperature = self._kelvin_range
+        span = max_temperature - min_temperature
+        if span > 0:
+            position = (temperature - min_temperature) * ((_KELVIN_LUT_SIZE - 1) / span)
+            index = min(max(int(round(position)), 0), _KELVIN_LUT_SIZE - 1)
         else:
-            r = min(1.0, 1.0 - (temperature - 6500) / 3500)
-            g = 1.0
-            b = 1.0
+            index = 0
         
-        light.data.color = (r, g, b)
+        light.data.color = self._kelvin_lut[index].tolist()
 
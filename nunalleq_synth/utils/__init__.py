@@ -5,12 +5,20 @@
 """Utility functions and helpers."""
 
 from nunalleq_synth.utils.logger import setup_logger, get_logger
-from nunalleq_synth.utils.gpu import detect_gpu, enable_gpu
+from nunalleq_synth.utils.gpu import detect_gpu, enable_gpu, list_cuda_devices
 from nunalleq_synth.utils.io import (
     ensure_dir,
     list_files,
+    list_files_cached,
+    iter_files,
+    count_files,
+    encode_image,
     save_image,
+    save_images_parallel,
     load_image,
+    image_size,
+    read_many,
+    parse_yolo_label,
 )
 
 __all__ = [
@@ -18,9 +26,18 @@ __all__ = [
     "get_logger",
     "detect_gpu",
     "enable_gpu",
+    "list_cuda_devices",
     "ensure_dir",
     "list_files",
+    "list_files_cached",
+    "iter_files",
+    "count_files",
+    "encode_image",
     "save_image",
+    "save_images_parallel",
     "load_image",
+    "image_size",
+    "read_many",
+    "parse_yolo_label",
 ]
 
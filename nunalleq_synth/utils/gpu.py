@@ -5,8 +5,9 @@
 """GPU detection and management utilities."""
 
 import logging
+import os
 import subprocess
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -30,37 +31,79 @@ def detect_gpu() -> Tuple[bool, Optional[str]]:
         return False, None
 
 
+def list_cuda_devices() -> List[str]:
+    """List the CUDA device IDs available to this process.
+    
+    Honors an existing CUDA_VISIBLE_DEVICES, so worker processes can be
+    pinned to a subset of the devices this process was given.
+    
+    Returns:
+        Device IDs suitable for CUDA_VISIBLE_DEVICES, empty if none.
+    """
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible is not None:
+        return [device for device in visible.split(",") if device.strip()]
+    
+    try:
+        result = subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=index", "--format=csv,noheader"],
+            encoding="utf-8",
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return []
+    
+    return [line.strip() for line in result.splitlines() if line.strip()]
+
+
+# Cycles compute backends, fastest first
+GPU_DEVICE_TYPES = ("OPTIX", "CUDA", "HIP", "METAL")
+
+
 def enable_gpu() -> bool:
     """Enable GPU acceleration for Blender if available.
     
+    Selects the first Cycles compute backend with devices available, in
+    the order of GPU_DEVICE_TYPES, enables its devices and disables CPU
+    devices so rendering is not held back by slower CPU tiles.
+    
     Returns:
         True if GPU enabled successfully, False otherwise.
     """
-    gpu_available, gpu_info = detect_gpu()
-    
-    if not gpu_available:
-        logger.info("GPU acceleration disabled - using CPU")
-        return False
-    
     try:
         import bpy
         
         # Set render engine to Cycles
         bpy.context.scene.render.engine = "CYCLES"
         
+        preferences = bpy.context.preferences.addons["cycles"].preferences
+        
+        # Pick the fastest backend that has devices
+        for device_type in GPU_DEVICE_TYPES:
+            try:
+                devices = preferences.get_devices_for_type(device_type)
+            except (TypeError, ValueError):
+                # Backend not supported by this Blender build
+                continue
+            if any(device.type != "CPU" for device in devices):
+                break
+        else:
+            logger.info("GPU acceleration disabled - using CPU")
+            return False
+        
         # Enable GPU compute
-        bpy.context.preferences.addons["cycles"].preferences.compute_device_type = "CUDA"
+        preferences.compute_device_type = device_type
         bpy.context.scene.cycles.device = "GPU"
         
         # Get devices
-        bpy.context.preferences.addons["cycles"].preferences.get_devices()
+        preferences.get_devices()
         
-        # Enable all devices
-        for device in bpy.context.preferences.addons["cycles"].preferences.devices:
-            device.use = True
-            logger.debug(f"Enabled device: {device.name}")
+        # Enable GPU devices only
+        for device in preferences.devices:
+            device.use = device.type == device_type
+            if device.use:
+                logger.debug("Enabled device: %s", device.name)
         
-        logger.info("GPU acceleration enabled for Blender")
+        logger.info(f"GPU acceleration enabled for Blender ({device_type})")
         return True
         
     except ImportError:
@@ -69,4 +112,3 @@ def enable_gpu() -> bool:
     except Exception as e:
         logger.error(f"Failed to enable GPU: {e}")
         return False
-
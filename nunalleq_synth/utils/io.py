@@ -4,15 +4,65 @@
 # ============================================================================
 """File I/O utilities."""
 
+import fnmatch
+import functools
+import hashlib
+import io
+import json
 import logging
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import cv2
 import numpy as np
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# libjpeg-turbo encoder, used for JPEG output when available
+try:
+    import turbojpeg
+    
+    _turbo_jpeg = turbojpeg.TurboJPEG()
+except (ImportError, OSError):
+    # Not installed, or the libjpeg-turbo shared library is missing
+    _turbo_jpeg = None
+
 logger = logging.getLogger(__name__)
 
+# Images at least this large are decoded straight from a memory map
+_MMAP_MIN_SIZE = 256 * 1024
+
+# Directories known to exist, so repeated saves skip the mkdir call
+_ENSURED_DIRS: Set[str] = set()
+
+# Label files exactly as written by YOLOAnnotator: one
+# "<class_id> <x_center> <y_center> <width> <height>" line per object
+_LABEL_FILE_RE = re.compile(rb"(?:\d+(?: \d+(?:\.\d+)?){4}(?:\r?\n|\Z))+")
+
+# Default location for cached directory listings
+_LISTING_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "nunalleq_synth"
+)
+
 
 def ensure_dir(path: Union[str, Path]) -> Path:
     """Ensure directory exists, create if it doesn't.
@@ -25,13 +75,27 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     """
     path = Path(path)
     path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(os.fspath(path))
     return path
 
 
+def _ensure_parent(path: str) -> None:
+    """Create the parent directory of a file path once per process.
+    
+    Args:
+        path: File path.
+    """
+    parent = os.path.dirname(path)
+    if parent and parent not in _ENSURED_DIRS:
+        os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+
 def list_files(
     directory: Union[str, Path],
     pattern: str = "*",
     recursive: bool = False,
+    sort: bool = True,
 ) -> List[Path]:
     """List files in directory matching pattern.
     
@@ -39,9 +103,10 @@ def list_files(
         directory: Directory to search.
         pattern: Glob pattern to match (e.g., "*.glb").
         recursive: If True, search recursively.
+        sort: If False, skip sorting for callers that do not need order.
         
     Returns:
-        List of matching file paths.
+        List of matching file paths, sorted unless ``sort`` is False.
     """
     directory = Path(directory)
     
@@ -49,56 +114,582 @@ def list_files(
         logger.warning(f"Directory does not exist: {directory}")
         return []
     
-    if recursive:
-        files = list(directory.rglob(pattern))
+    if "**" in pattern or os.sep in pattern:
+        # Patterns spanning directories need full glob semantics
+        matches = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        files = [path for path in matches if path.is_file()]
+    else:
+        files = [
+            Path(path) for path in _walk_files(directory, pattern, recursive)[0]
+        ]
+    
+    logger.debug("Found %s files matching '%s' in %s", len(files), pattern, directory)
+    if sort:
+        files.sort()
+    return files
+
+
+def _iter_paths(directory: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """Yield matching file paths while scanning, without collecting them.
+    
+    Args:
+        directory: Directory to search.
+        pattern: Glob pattern matched against file names.
+        recursive: If True, search recursively.
+        
+    Yields:
+        Matching file paths, in directory order.
+    """
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    # Like Path.rglob, do not follow directory symlinks
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern):
+                        yield entry.path
+        except OSError as e:
+            logger.debug("Cannot scan directory: %s", e)
+
+
+def iter_files(
+    directory: Union[str, Path],
+    pattern: str = "*",
+    recursive: bool = False,
+) -> Iterator[Path]:
+    """Iterate over files in directory matching pattern.
+    
+    Unlike list_files(), files are yielded as they are found, in no
+    particular order, without building a list first.
+    
+    Args:
+        directory: Directory to search.
+        pattern: Glob pattern to match (e.g., "*.glb").
+        recursive: If True, search recursively.
+        
+    Yields:
+        Matching file paths.
+    """
+    directory = Path(directory)
+    
+    if not directory.is_dir():
+        logger.warning(f"Directory does not exist: {directory}")
+        return
+    
+    if "**" in pattern or os.sep in pattern:
+        # Patterns spanning directories need full glob semantics
+        matches = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        yield from (path for path in matches if path.is_file())
+        return
+    
+    for path in _iter_paths(os.fspath(directory), pattern, recursive):
+        yield Path(path)
+
+
+def count_files(
+    directory: Union[str, Path],
+    pattern: str = "*",
+    recursive: bool = False,
+) -> int:
+    """Count files in directory matching pattern.
+    
+    Streams directory entries instead of building and sorting a list,
+    for callers that only need the number of files.
+    
+    Args:
+        directory: Directory to search.
+        pattern: Glob pattern matched against file names (e.g., "*.jpg").
+        recursive: If True, search recursively.
+        
+    Returns:
+        Number of matching files.
+    """
+    directory = os.fspath(directory)
+    if not os.path.isdir(directory):
+        logger.warning(f"Directory does not exist: {directory}")
+        return 0
+    
+    return sum(1 for _ in _iter_paths(directory, pattern, recursive))
+
+
+def _scan_dir(
+    directory: str,
+    pattern: str,
+) -> Tuple[List[str], List[str], Optional[int]]:
+    """Scan one directory for matching files and subdirectories.
+    
+    Args:
+        directory: Directory to scan.
+        pattern: Glob pattern matched against file names.
+        
+    Returns:
+        Tuple of (matching file paths, subdirectory paths, directory
+        mtime_ns or None if it could not be read).
+    """
+    files = []
+    subdirs = []
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # File types come from the directory entry, without a stat.
+                # Directory symlinks are not followed, as in Path.rglob, so
+                # a link back up the tree cannot loop.
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern):
+                    files.append(entry.path)
+    except OSError as e:
+        logger.debug("Cannot scan %s: %s", directory, e)
+        return files, subdirs, None
+    
+    return files, subdirs, mtime_ns
+
+
+def _walk_files(
+    directory: Union[str, Path],
+    pattern: str,
+    recursive: bool = True,
+    max_workers: int = 8,
+) -> Tuple[List[str], Dict[str, int]]:
+    """Walk a directory tree with os.scandir, several directories at a time.
+    
+    Faster than Path.rglob on large trees since file types come from the
+    directory entries, no Path objects are created, and directory reads
+    from a thread pool overlap each other.
+    
+    Args:
+        directory: Directory to search.
+        pattern: Glob pattern matched against file names.
+        recursive: If False, only scan ``directory`` itself.
+        max_workers: Number of threads scanning directories.
+        
+    Returns:
+        Tuple of (matching file paths, mtime_ns of every directory walked).
+    """
+    root = os.fspath(directory)
+    if not recursive:
+        files, _, mtime_ns = _scan_dir(root, pattern)
+        return files, {} if mtime_ns is None else {root: mtime_ns}
+    
+    files = []
+    dir_mtimes = {}
+    
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="scandir",
+    ) as executor:
+        pending = {executor.submit(_scan_dir, root, pattern): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current = pending.pop(future)
+                dir_files, subdirs, mtime_ns = future.result()
+                files.extend(dir_files)
+                if mtime_ns is not None:
+                    dir_mtimes[current] = mtime_ns
+                for subdir in subdirs:
+                    pending[executor.submit(_scan_dir, subdir, pattern)] = subdir
+    
+    return files, dir_mtimes
+
+
+def list_files_cached(
+    directory: Union[str, Path],
+    pattern: str = "*",
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> List[Path]:
+    """List files in a directory tree, reusing a listing cached on disk.
+    
+    The cache records the mtime of every directory in the tree and is
+    reused while none of them has changed, which is the case unless files
+    were added, removed or renamed. Checking it only stats directories.
+    
+    Args:
+        directory: Directory to search recursively.
+        pattern: Glob pattern to match (e.g., "*.glb").
+        cache_dir: Directory holding cached listings. Defaults to
+            ~/.cache/nunalleq_synth.
+        
+    Returns:
+        Sorted list of matching file paths.
+    """
+    directory = Path(directory).resolve()
+    
+    if not directory.exists():
+        logger.warning(f"Directory does not exist: {directory}")
+        return []
+    
+    cache_dir = Path(cache_dir) if cache_dir is not None else _LISTING_CACHE_DIR
+    key = hashlib.sha1(f"{directory}\0{pattern}".encode()).hexdigest()
+    cache_path = cache_dir / f"files-{key}.json"
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        for path, mtime_ns in cached["dirs"].items():
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                break
+        else:
+            logger.debug("Using cached listing of %s", directory)
+            return [Path(path) for path in cached["files"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    files, dir_mtimes = _walk_files(directory, pattern)
+    files.sort()
+    
+    # Write to a temporary file first so readers never see a partial cache
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"dirs": dir_mtimes, "files": files}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache file listing of {directory}: {e}")
+    
+    logger.debug("Found %s files matching '%s' in %s", len(files), pattern, directory)
+    return [Path(path) for path in files]
+
+
+def _read_file(path: Union[str, Path]) -> Optional[bytes]:
+    """Read a whole file, or return None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        logger.debug("Cannot read %s: %s", path, e)
+        return None
+
+
+def read_many(
+    paths: Iterable[Union[str, Path]],
+    depth: int = 64,
+) -> Iterator[Tuple[Union[str, Path], Optional[bytes]]]:
+    """Read many small files with several reads in flight at once.
+    
+    Up to ``depth`` files are read concurrently by a thread pool, which
+    hides per-file open and read latency on network storage and keeps
+    the device queue busy. Results are yielded in the order of ``paths``
+    and at most ``depth`` file contents are held in memory at a time.
+    
+    Args:
+        paths: Files to read.
+        depth: Maximum number of reads in flight.
+        
+    Yields:
+        (path, contents) tuples, contents None if the file could not be
+        read.
+    """
+    with ThreadPoolExecutor(max_workers=depth, thread_name_prefix="read") as executor:
+        in_flight: Deque[Tuple[Union[str, Path], Future]] = deque()
+        for path in paths:
+            if len(in_flight) >= depth:
+                done_path, future = in_flight.popleft()
+                yield done_path, future.result()
+            in_flight.append((path, executor.submit(_read_file, path)))
+        
+        while in_flight:
+            done_path, future = in_flight.popleft()
+            yield done_path, future.result()
+
+
+def _encode_turbo_jpeg(
+    image: np.ndarray,
+    quality: int,
+    is_bgr: bool = False,
+) -> Optional[bytes]:
+    """Encode an RGB, BGR or grayscale image as JPEG with libjpeg-turbo.
+    
+    Color input is encoded in its own channel order, so no conversion is
+    needed.
+    
+    Args:
+        image: Image array (RGB, BGR or grayscale).
+        quality: JPEG quality (0-100).
+        is_bgr: Whether a 3-channel image is in BGR order.
+        
+    Returns:
+        JPEG data, or None if the image layout is not supported.
+    """
+    if image.ndim == 3 and image.shape[2] == 3:
+        pixel_format = turbojpeg.TJPF_BGR if is_bgr else turbojpeg.TJPF_RGB
+        subsample = turbojpeg.TJSAMP_420
+    elif image.ndim == 2:
+        pixel_format = turbojpeg.TJPF_GRAY
+        subsample = turbojpeg.TJSAMP_GRAY
+        image = image[:, :, np.newaxis]
     else:
-        files = list(directory.glob(pattern))
+        return None
     
-    logger.debug(f"Found {len(files)} files matching '{pattern}' in {directory}")
-    return sorted(files)
+    return _turbo_jpeg.encode(
+        np.ascontiguousarray(image),
+        quality=quality,
+        pixel_format=pixel_format,
+        jpeg_subsample=subsample,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _jpeg_params(quality: int) -> Tuple[int, int]:
+    """Get the OpenCV encoder parameters for a JPEG quality, built once each."""
+    return (cv2.IMWRITE_JPEG_QUALITY, quality)
+
+
+def _drop_cached_pages(path: str) -> None:
+    """Write a file's data to disk and evict it from the page cache.
+    
+    Dirty pages cannot be dropped, so the data is flushed with fdatasync
+    first. Does nothing where posix_fadvise is not available.
+    
+    Args:
+        path: File path.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        # Only advisory; the file itself was written
+        logger.debug("Cannot drop cached pages of %s: %s", path, e)
+
+
+def encode_image(
+    image: np.ndarray,
+    quality: int = 95,
+    ext: str = ".jpg",
+    inplace: bool = False,
+    is_bgr: bool = False,
+) -> Optional[bytes]:
+    """Encode an image to the bytes of an image file.
+    
+    JPEG files are encoded with libjpeg-turbo through PyTurboJPEG when it
+    is installed, and with OpenCV otherwise.
+    
+    Args:
+        image: Image array (RGB, BGR or grayscale).
+        quality: JPEG quality (0-100).
+        ext: File extension selecting the format, such as ".jpg" or ".png".
+        inplace: If True, convert a 3-channel image to BGR in its own
+            buffer instead of a copy when OpenCV encodes it. The caller's
+            array is then left in BGR order.
+        is_bgr: If True, a 3-channel image is already in BGR order, as
+            produced by OpenCV, and is encoded without a conversion copy.
+        
+    Returns:
+        Encoded file contents, or None if encoding failed.
+    """
+    if _turbo_jpeg is not None and ext.lower() in (".jpg", ".jpeg"):
+        data = _encode_turbo_jpeg(image, quality, is_bgr=is_bgr)
+        if data is not None:
+            return data
+    
+    # Convert RGB to BGR for OpenCV
+    if is_bgr:
+        image_bgr = image
+    elif len(image.shape) == 3 and image.shape[2] == 3:
+        if inplace:
+            image_bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=image)
+        else:
+            image_bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    else:
+        image_bgr = image
+    
+    success, buffer = cv2.imencode(ext, image_bgr, _jpeg_params(quality))
+    return buffer.tobytes() if success else None
+
+
+def _write_bytes(path: str, data: bytes) -> bool:
+    """Write data to a file, creating its directory if needed.
+    
+    If the directory was removed after it was created, it is created
+    again and the write retried once.
+    
+    Args:
+        path: Output path.
+        data: File contents.
+        
+    Returns:
+        True if successful, False otherwise.
+    """
+    try:
+        _ensure_parent(path)
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+        except FileNotFoundError:
+            _ENSURED_DIRS.discard(os.path.dirname(path))
+            _ensure_parent(path)
+            with open(path, 'wb') as f:
+                f.write(data)
+        return True
+    except OSError as e:
+        _ENSURED_DIRS.discard(os.path.dirname(path))
+        logger.error(f"Error writing {path}: {e}")
+        return False
 
 
 def save_image(
     image: np.ndarray,
     path: Union[str, Path],
     quality: int = 95,
+    inplace: bool = False,
+    drop_cache: bool = False,
+    is_bgr: bool = False,
 ) -> bool:
     """Save image to disk.
     
+    The image is encoded in memory by encode_image() and written with a
+    single write call.
+    
     Args:
         image: Image array (RGB or BGR format).
         path: Output path.
         quality: JPEG quality (0-100).
+        inplace: If True, convert a 3-channel image to BGR in its own
+            buffer instead of a copy when OpenCV encodes it. The caller's
+            array is then left in BGR order.
+        drop_cache: If True, flush the file and evict it from the page
+            cache after writing, so large write-once outputs do not push
+            out data that is read again. Makes each save synchronous.
+        is_bgr: If True, a 3-channel image is already in BGR order and
+            is written without a color conversion.
         
     Returns:
         True if successful, False otherwise.
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    path = os.fspath(path)
     
     try:
-        # Convert RGB to BGR for OpenCV
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            image_bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        else:
-            image_bgr = image
+        data = encode_image(
+            image,
+            quality=quality,
+            ext=os.path.splitext(path)[1],
+            inplace=inplace,
+            is_bgr=is_bgr,
+        )
+    except Exception as e:
+        logger.error(f"Error saving image to {path}: {e}")
+        return False
+    
+    if data is None:
+        logger.error(f"Failed to save image to {path}")
+        return False
+    
+    if not _write_bytes(path, data):
+        return False
+    
+    if drop_cache:
+        _drop_cached_pages(path)
+    logger.debug("Saved image to %s", path)
+    return True
+
+
+def save_images_parallel(
+    items: Sequence[Tuple[np.ndarray, Union[str, Path]]],
+    quality: int = 95,
+    workers: Optional[int] = None,
+    drop_cache: bool = False,
+    is_bgr: bool = False,
+) -> List[bool]:
+    """Save several images concurrently.
+    
+    OpenCV releases the GIL while encoding and writing, so a thread pool
+    encodes one image per core without copying the arrays to other
+    processes.
+    
+    Args:
+        items: (image, output path) pairs, as passed to save_image().
+        quality: JPEG quality (0-100).
+        workers: Number of threads. Defaults to the CPU count.
+        drop_cache: Evict each file from the page cache after writing,
+            see save_image().
+        is_bgr: Whether the images are already in BGR order, see
+            save_image().
         
-        success = cv2.imwrite(
-            str(path),
-            image_bgr,
-            [cv2.IMWRITE_JPEG_QUALITY, quality],
+    Returns:
+        Success flag for each item, in order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="encode",
+    ) as executor:
+        return list(
+            executor.map(
+                lambda item: save_image(
+                    item[0],
+                    item[1],
+                    quality=quality,
+                    drop_cache=drop_cache,
+                    is_bgr=is_bgr,
+                ),
+                items,
+            )
         )
+
+
+def image_size(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """Get the dimensions of an image without decoding its pixels.
+    
+    Pillow only parses the file header until pixel data is accessed, so
+    this reads a few hundred bytes instead of the whole image. Without
+    Pillow the image is decoded with OpenCV.
+    
+    Args:
+        path: Image path.
         
-        if success:
-            logger.debug(f"Saved image to {path}")
-        else:
-            logger.error(f"Failed to save image to {path}")
+    Returns:
+        (width, height), or None if the image cannot be read.
+    """
+    try:
+        if Image is not None:
+            with Image.open(path) as image:
+                return image.size
         
-        return success
+        image = cv2.imread(os.fspath(path), cv2.IMREAD_UNCHANGED)
+        if image is None:
+            logger.error(f"Failed to load image: {path}")
+            return None
+        return image.shape[1], image.shape[0]
         
     except Exception as e:
-        logger.error(f"Error saving image to {path}: {e}")
-        return False
+        logger.error(f"Error reading image size of {path}: {e}")
+        return None
+
+
+def _mmap_decode(path: Union[str, Path], flags: int) -> Optional[np.ndarray]:
+    """Decode an image from a read-only memory map of its file.
+    
+    The decoder reads the page cache directly, without first copying
+    the file into a read buffer.
+    
+    Args:
+        path: Image path.
+        flags: cv2.imdecode flags.
+        
+    Returns:
+        Decoded image, or None if decoding failed.
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                return cv2.imdecode(data, flags)
+            finally:
+                # The map cannot be closed while the array still exports it
+                del data
 
 
 def load_image(
@@ -114,24 +705,30 @@ def load_image(
     Returns:
         Image array or None if loading failed.
     """
-    path = Path(path)
-    
-    if not path.exists():
+    try:
+        size = os.stat(path).st_size
+    except OSError:
         logger.error(f"Image file does not exist: {path}")
         return None
     
     try:
-        if color_mode == "GRAY":
-            image = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        flags = cv2.IMREAD_GRAYSCALE if color_mode == "GRAY" else cv2.IMREAD_COLOR
+        
+        # Large files skip the read buffer copy; small ones are not worth
+        # setting up a mapping for
+        if size >= _MMAP_MIN_SIZE:
+            image = _mmap_decode(path, flags)
         else:
-            image = cv2.imread(str(path))
-            if color_mode == "RGB" and image is not None:
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            image = cv2.imread(os.fspath(path), flags)
+        
+        if color_mode == "RGB" and image is not None:
+            # The decoded buffer is ours, so convert it in place
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
         
         if image is None:
             logger.error(f"Failed to load image: {path}")
         else:
-            logger.debug(f"Loaded image from {path}")
+            logger.debug("Loaded image from %s", path)
         
         return image
         
@@ -139,3 +736,49 @@ def load_image(
         logger.error(f"Error loading image from {path}: {e}")
         return None
 
+
+def parse_yolo_label(path: Union[str, Path]) -> np.ndarray:
+    """Parse a YOLO label file into an array.
+    
+    Files matching the annotator's output format are syntax-checked with
+    a single precompiled regex and converted with one NumPy call.
+    Anything else is checked line by line to find the exact problem: each
+    line, blank ones included, needs an integer class id and four floats.
+    Value ranges are not checked.
+    
+    Args:
+        path: Label file path.
+        
+    Returns:
+        Array of shape (N, 5) with one
+        (class_id, x_center, y_center, width, height) row per object.
+        
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is empty or malformed.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if not data:
+        raise ValueError(f"Empty label file: {path}")
+    
+    if _LABEL_FILE_RE.fullmatch(data):
+        return np.array(data.split(), dtype=np.float64).reshape(-1, 5)
+    
+    try:
+        text = data.decode()
+    except UnicodeDecodeError:
+        raise ValueError(f"Non-numeric values in {path}")
+    
+    rows = []
+    for line in io.StringIO(text, newline=None):
+        parts = line.split()
+        if len(parts) != 5:
+            raise ValueError(f"Invalid format in {path}: {line.strip()}")
+        try:
+            rows.append([int(parts[0])] + [float(part) for part in parts[1:]])
+        except ValueError:
+            raise ValueError(f"Non-numeric values in {path}")
+    
+    return np.array(rows, dtype=np.float64)
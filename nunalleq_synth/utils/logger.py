@@ -4,10 +4,27 @@
 # ============================================================================
 """Logging utilities for nunalleq-synth."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Background listener writing records queued by setup_logger()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, writing out any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 def setup_logger(
@@ -17,6 +34,10 @@ def setup_logger(
 ) -> logging.Logger:
     """Setup application-wide logger.
     
+    Records are put on a queue and written by a background listener
+    thread, so logging calls do not wait for console or file I/O. The
+    queue is drained at interpreter exit.
+    
     Args:
         level: Logging level (e.g., logging.INFO, logging.DEBUG).
         log_file: Optional path to log file. If None, logs to console only.
@@ -41,7 +62,7 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
     # File handler (optional)
     if log_file:
@@ -49,7 +70,25 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Replace the queue and listener of an earlier call
+    global _listener, _queue_handler
+    _stop_listener()
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+    else:
+        atexit.register(_stop_listener)
+    
+    record_queue: queue.Queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(record_queue)
+    root_logger.addHandler(_queue_handler)
+    _listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Records are fully handled here; skip the walk up to the root logger
+    # and avoid printing them twice if the root logger has handlers too
+    root_logger.propagate = False
     
     return root_logger
 
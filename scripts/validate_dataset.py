@@ -7,23 +7,63 @@
 
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 from nunalleq_synth.annotation.validation import AnnotationValidator
-from nunalleq_synth.utils.io import list_files
+from nunalleq_synth.utils.io import count_files
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _validate_split(
+    dataset_dir: Path,
+    split: str,
+) -> Tuple[Optional[Dict[str, int]], int, int, List[str]]:
+    """Count and validate the files of one split, in a worker process.
+    
+    Args:
+        dataset_dir: Root directory of dataset.
+        split: Split name ('train', 'test', or 'val').
+        
+    Returns:
+        Tuple of (file counts or None if the split has no images
+        directory, valid_count, invalid_count, error_messages).
+    """
+    images_dir = dataset_dir / split / 'images'
+    labels_dir = dataset_dir / split / 'labels'
+    
+    counts = None
+    if images_dir.exists():
+        # Only the counts are reported, so skip building sorted lists
+        counts = {
+            "num_images": count_files(images_dir, "*.jpg"),
+            "num_labels": count_files(labels_dir, "*.txt"),
+        }
+    
+    valid_count, invalid_count, errors = AnnotationValidator().validate_split(
+        dataset_dir,
+        split,
+    )
+    return counts, valid_count, invalid_count, errors
 
 
 def generate_report(dataset_dir: Path) -> Dict[str, Any]:
     """Generate validation report for dataset.
     
+    Splits are validated concurrently, one worker process each.
+    
     Args:
         dataset_dir: Root directory of dataset.
         
     Returns:
         Dictionary containing validation report.
     """
-    validator = AnnotationValidator()
+    splits = ['train', 'test', 'val']
     
     report = {
         "dataset_dir": str(dataset_dir),
@@ -36,29 +76,20 @@ def generate_report(dataset_dir: Path) -> Dict[str, Any]:
     all_errors = []
     
     # Validate each split
-    for split in ['train', 'test', 'val']:
-        images_dir = dataset_dir / split / 'images'
-        labels_dir = dataset_dir / split / 'labels'
-        
-        if not images_dir.exists():
-            continue
-        
-        image_files = list_files(images_dir, "*.jpg")
-        label_files = list_files(labels_dir, "*.txt")
+    with ProcessPoolExecutor(max_workers=len(splits)) as executor:
+        futures = [
+            executor.submit(_validate_split, dataset_dir, split) for split in splits
+        ]
         
-        report["splits"][split] = {
-            "num_images": len(image_files),
-            "num_labels": len(label_files),
-        }
-        
-        total_valid += len(image_files)
-    
-    # Validate annotations
-    valid_count, invalid_count, errors = validator.validate_dataset(dataset_dir)
-    
-    total_valid = valid_count
-    total_invalid = invalid_count
-    all_errors = errors
+        # Collect in split order so errors are reported in a stable order
+        for split, future in zip(splits, futures):
+            counts, valid_count, invalid_count, errors = future.result()
+            if counts is not None:
+                report["splits"][split] = counts
+            
+            total_valid += valid_count
+            total_invalid += invalid_count
+            all_errors.extend(errors)
     
     # Summary
     report["summary"] = {
@@ -111,8 +142,11 @@ def main() -> None:
     
     # Save report
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(report, indent=2).encode()
+        args.output.write_bytes(data)
         print(f"\nReport saved to: {args.output}")
     
     # Print some errors
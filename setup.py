@@ -29,6 +29,12 @@ blender_requires = [
     "bpy>=3.6.0; python_version=='3.11'",  # bpy only works on Python 3.11
 ]
 
+# Faster JSON config parsing and JPEG encoding (optional)
+fast_requires = [
+    "orjson>=3.9.0",
+    "PyTurboJPEG>=1.7.0",
+]
+
 # Development dependencies
 dev_requires = [
     "pytest>=7.3.0",
@@ -74,7 +80,8 @@ setup(
         "blender": blender_requires,
         "dev": dev_requires,
         "docs": doc_requires,
-        "all": blender_requires + dev_requires + doc_requires,
+        "fast": fast_requires,
+        "all": blender_requires + fast_requires + dev_requires + doc_requires,
     },
     entry_points={
         "console_scripts": [
@@ -6,8 +6,16 @@
 
 import pytest
 from pathlib import Path
+import sys
 import tempfile
 import shutil
+from unittest.mock import MagicMock
+
+# One Blender mock for the whole session. It is installed before any
+# package module is imported, so every module binds to this same object.
+_previous_bpy = sys.modules.get('bpy')
+_mock_bpy = MagicMock()
+sys.modules['bpy'] = _mock_bpy
 
 from nunalleq_synth.pipeline.config import GenerationConfig
 
@@ -39,18 +47,13 @@ def sample_config(temp_dir):
     return config
 
 
-@pytest.fixture
-def mock_blender(monkeypatch):
+@pytest.fixture(scope="session")
+def mock_blender():
     """Mock Blender imports for testing without Blender."""
-    import sys
-    from unittest.mock import MagicMock
-    
-    # Create mock bpy module
-    mock_bpy = MagicMock()
-    sys.modules['bpy'] = mock_bpy
-    
-    yield mock_bpy
+    yield _mock_bpy
     
     # Cleanup
-    if 'bpy' in sys.modules:
-        del sys.modules['bpy']
\ No newline at end of file
+    if _previous_bpy is not None:
+        sys.modules['bpy'] = _previous_bpy
+    else:
+        sys.modules.pop('bpy', None)
\ No newline at end of file
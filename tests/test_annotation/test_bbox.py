@@ -0,0 +1,105 @@
+# ============================================================================
+# tests/test_annotation/test_bbox.py
+# ============================================================================
+"""Tests for bounding box calculation."""
+
+import itertools
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from nunalleq_synth.annotation.bbox import BoundingBoxCalculator
+
+_session_uids = itertools.count(1)
+
+
+class _Vertices:
+    """Stand-in for mesh.vertices backed by a NumPy array."""
+    
+    def __init__(self, coords):
+        self._coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+    
+    def __len__(self):
+        return len(self._coords)
+    
+    def foreach_get(self, attr, out):
+        out[:] = self._coords.ravel()
+
+
+class _Camera:
+    """Camera at the origin looking down -Z with a fixed perspective."""
+    
+    def __init__(self, aspect, near=0.1, far=100.0):
+        self.camera_obj = SimpleNamespace(
+            matrix_world=SimpleNamespace(inverted=lambda: np.eye(4))
+        )
+        self._projection = np.array([
+            [1.0 / aspect, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, (far + near) / (near - far), 2 * far * near / (near - far)],
+            [0.0, 0.0, -1.0, 0.0],
+        ])
+    
+    def get_projection_matrix(self):
+        return self._projection
+
+
+def _make_object(name, coords, location=(0.0, 0.0, 0.0)):
+    """Create a stand-in for a mesh object at a location."""
+    matrix_world = np.eye(4)
+    matrix_world[:3, 3] = location
+    return SimpleNamespace(
+        name=name,
+        data=SimpleNamespace(
+            session_uid=next(_session_uids),
+            vertices=_Vertices(coords),
+        ),
+        matrix_world=matrix_world,
+    )
+
+
+def _cube(size=1.0):
+    """Get the corner vertices of a cube centered on the origin."""
+    half = size / 2
+    return list(itertools.product((-half, half), repeat=3))
+
+
+def test_calculate_bboxes_batch_matches_calculate_bbox():
+    """Test that the batched projection agrees with the per-object one."""
+    resolution = (640, 480)
+    camera = _Camera(aspect=640 / 480)
+    objects = [
+        # Fully in view
+        _make_object("inside", _cube(), location=(0.0, 0.0, -5.0)),
+        # Partly beyond the right edge of the image
+        _make_object("off_screen", _cube(2.0), location=(6.0, 0.5, -5.0)),
+        # One vertex behind the camera (w < 0) and one on its plane (w = 0)
+        _make_object(
+            "behind_vertex",
+            _cube() + [(0.0, 0.0, 4.0), (0.5, 0.5, 3.0)],
+            location=(-1.0, -0.5, -3.0),
+        ),
+        # Entirely behind the camera
+        _make_object("behind", _cube(), location=(0.0, 0.0, 5.0)),
+        # No geometry
+        _make_object("empty", []),
+        _make_object("far", _cube(0.5), location=(1.0, 1.0, -20.0)),
+    ]
+    class_ids = list(range(len(objects)))
+    
+    calculator = BoundingBoxCalculator()
+    batch = calculator.calculate_bboxes_batch(
+        objects, camera, resolution, class_ids=class_ids
+    )
+    expected = [
+        (class_id, bbox)
+        for obj, class_id in zip(objects, class_ids)
+        for bbox in [calculator.calculate_bbox(obj, camera, resolution)]
+        if bbox is not None
+    ]
+    
+    assert [class_id for class_id, _ in expected] == [0, 1, 2, 5]
+    assert list(batch.to_records()) == expected
+    
+    # The off-screen object is clamped to the image
+    assert expected[1][1].x_max == resolution[0]
@@ -0,0 +1,68 @@
+# ============================================================================
+# tests/test_annotation/test_validation.py
+# ============================================================================
+"""Tests for annotation validation."""
+
+import pytest
+from nunalleq_synth.annotation.bbox import BoundingBox, BoundingBoxArray
+from nunalleq_synth.annotation.validation import AnnotationValidator
+
+
+def _make_sample(dataset_dir, name, label_text):
+    """Write an empty image and its label file into the train split."""
+    for split in ['train', 'test', 'val']:
+        (dataset_dir / split / 'images').mkdir(parents=True, exist_ok=True)
+        (dataset_dir / split / 'labels').mkdir(parents=True, exist_ok=True)
+    
+    (dataset_dir / 'train' / 'images' / f"{name}.jpg").write_bytes(b"")
+    (dataset_dir / 'train' / 'labels' / f"{name}.txt").write_text(label_text)
+
+
+def test_validate_dataset_valid_labels(temp_dir):
+    """Test that well-formed labels are counted as valid."""
+    _make_sample(temp_dir, "a", "0 0.5 0.5 0.2 0.2\n1 0.1 0.9 0.1 0.1\n")
+    
+    valid, invalid, errors = AnnotationValidator().validate_dataset(temp_dir)
+    
+    assert valid == 1
+    assert invalid == 0
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    "label_text, message",
+    [
+        ("", "Empty label file"),
+        ("0 0.5 0.5 0.2\n", "Invalid format"),
+        ("0 x 0.5 0.2 0.2\n", "Non-numeric values"),
+        ("0 1.5 0.5 0.2 0.2\n", "Invalid coordinates"),
+        ("0 0.5 0.5 0.0 0.2\n", "Invalid dimensions"),
+        ("0 0.5 0.5 0.2 0.2 # x\n", "Invalid format"),
+        ("0 0.5 0.5 0.2 0.2\n\n1 0.5 0.5 0.2 0.2\n", "Invalid format"),
+        ("0.0 0.5 0.5 0.2 0.2\n", "Non-numeric values"),
+    ],
+)
+def test_validate_dataset_invalid_labels(temp_dir, label_text, message):
+    """Test that malformed labels are reported."""
+    _make_sample(temp_dir, "a", label_text)
+    
+    valid, invalid, errors = AnnotationValidator().validate_dataset(temp_dir)
+    
+    assert valid == 0
+    assert invalid == 1
+    assert errors[0].startswith(message)
+
+
+def test_validate_bboxes_matches_validate_bbox():
+    """Test that the vectorized check agrees with the per-box check."""
+    records = [
+        (0, BoundingBox(0, 0, 20, 20, 0.5, 0.5, 0.2, 0.2, 400)),
+        (1, BoundingBox(0, 0, 5, 5, 0.5, 0.5, 0.1, 0.1, 25)),
+        (2, BoundingBox(0, 0, 20, 20, 1.5, 0.5, 0.2, 0.2, 400)),
+        (0, BoundingBox(0, 0, 20, 20, 0.5, 0.5, 0.0, 0.2, 400)),
+    ]
+    validator = AnnotationValidator()
+    
+    mask = validator.validate_bboxes(BoundingBoxArray.from_records(records))
+    
+    assert mask.tolist() == [validator.validate_bbox(b) for _, b in records]
@@ -0,0 +1,61 @@
+# ============================================================================
+# tests/test_core/test_physics.py
+# ============================================================================
+"""Tests for physics simulation."""
+
+import pytest
+from types import SimpleNamespace
+from nunalleq_synth.core.physics import PhysicsSimulator
+
+
+def _make_body(name, location, enabled=True):
+    """Create a stand-in for an object with a rigid body."""
+    return SimpleNamespace(
+        name=name,
+        location=location,
+        rotation_mode='XYZ',
+        rotation_euler=(0.0, 0.0, 0.0),
+        scale=(1.0, 1.0, 1.0),
+        data=None,
+        rigid_body=SimpleNamespace(
+            type='ACTIVE',
+            enabled=enabled,
+            mass=1.0,
+            friction=0.5,
+            restitution=0.3,
+            collision_shape='CONVEX_HULL',
+        ),
+    )
+
+
+@pytest.fixture
+def simulator(mock_blender, monkeypatch):
+    """Create a simulator whose scene objects can be set by the test."""
+    monkeypatch.setattr(mock_blender.types, "Mesh", type("Mesh", (), {}))
+    monkeypatch.setattr(mock_blender.context.scene, "objects", [])
+    return PhysicsSimulator()
+
+
+def test_cache_key_depends_on_drop_location(simulator, mock_blender):
+    """Test that scenes differing only in drop location get different keys."""
+    scene = mock_blender.context.scene
+    
+    scene.objects = [_make_body("a", (0.0, 0.0, 1.0))]
+    first = simulator._cache_key(1, 120)
+    scene.objects = [_make_body("a", (0.3, -0.2, 1.0))]
+    second = simulator._cache_key(1, 120)
+    
+    assert first != second
+
+
+def test_cache_key_ignores_disabled_bodies(simulator, mock_blender):
+    """Test that parked, disabled bodies do not change the key."""
+    scene = mock_blender.context.scene
+    dropped = _make_body("a", (0.0, 0.0, 1.0))
+    
+    scene.objects = [dropped, _make_body("b", (100.0, 0.0, 0.0), enabled=False)]
+    first = simulator._cache_key(1, 120)
+    scene.objects = [dropped, _make_body("b", (200.0, 0.0, 0.0), enabled=False)]
+    second = simulator._cache_key(1, 120)
+    
+    assert first == second
@@ -5,6 +5,7 @@
 
 import pytest
 from nunalleq_synth.core.scene import Scene
+from nunalleq_synth.objects import material
 
 
 def test_scene_initialization(mock_blender):
@@ -22,6 +23,17 @@ def test_scene_clear(mock_blender):
     scene = Scene()
     scene.clear()
     
-    # Verify clear was called
-    mock_blender.ops.object.select_all.assert_called()
+    # Verify objects were removed and orphan data purged
+    mock_blender.data.orphans_purge.assert_called_with(do_recursive=True)
 
+
+def test_scene_clear_drops_material_caches(mock_blender):
+    """Test that purged materials cannot be found in the node lookup cache."""
+    scene = Scene()
+    material._bsdf_cache[1] = (2, None)
+    material._material_cache[("color",)] = "Material"
+    
+    scene.clear()
+    
+    assert material._bsdf_cache == {}
+    assert material._material_cache == {}
@@ -0,0 +1,122 @@
+# ============================================================================
+# tests/test_pipeline/test_config.py
+# ============================================================================
+"""Tests for configuration loading and saving."""
+
+import pytest
+from pathlib import Path
+import nunalleq_synth.pipeline.config as config_module
+from nunalleq_synth.pipeline.config import (
+    AnnotationConfig,
+    GenerationConfig,
+    PhysicsConfig,
+    RenderConfig,
+    load_config,
+    peek_config,
+    save_config,
+)
+
+
+@pytest.fixture
+def full_config(temp_dir):
+    """Create a config using Optional, Literal, tuple, Path and nested fields."""
+    return GenerationConfig(
+        model_dir=temp_dir / "models",
+        output_dir=temp_dir / "output",
+        num_images=7,
+        train_test_val_split=(0.6, 0.2, 0.2),
+        random_seed=None,
+        physics=PhysicsConfig(cache_dir=temp_dir / "cache"),
+        render=RenderConfig(engine="EEVEE", denoiser=None, resolution=(64, 32)),
+        annotation=AnnotationConfig(format="coco", class_names=["ulu", "mask"]),
+    )
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json"])
+def test_trusted_load_round_trip(temp_dir, full_config, suffix):
+    """Test that a saved config loads back unchanged without validation."""
+    config_path = temp_dir / f"config{suffix}"
+    save_config(full_config, config_path)
+    
+    loaded = load_config(config_path, trusted=True)
+    
+    assert loaded == full_config
+    assert isinstance(loaded.render.resolution, tuple)
+    assert isinstance(loaded.physics.cache_dir, Path)
+    assert isinstance(loaded.render, RenderConfig)
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json"])
+def test_validated_load_round_trip(temp_dir, full_config, suffix):
+    """Test that a saved config loads back unchanged with validation."""
+    config_path = temp_dir / f"config{suffix}"
+    save_config(full_config, config_path)
+    
+    assert load_config(config_path) == full_config
+
+
+def test_peek_config_full_header(temp_dir, full_config, monkeypatch):
+    """Test that keys near the top are read without loading the file."""
+    config_path = temp_dir / "config.yaml"
+    save_config(full_config, config_path)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("full config was loaded")
+    
+    monkeypatch.setattr(config_module, "load_config", fail)
+    
+    assert peek_config(config_path) == {
+        "num_images": 7,
+        "train_test_val_split": [0.6, 0.2, 0.2],
+    }
+
+
+def test_peek_config_short_header(temp_dir):
+    """Test that keys missing from the file fall back to their defaults."""
+    config_path = temp_dir / "config.yaml"
+    config_path.write_text(
+        f"model_dir: {temp_dir / 'models'}\n"
+        f"output_dir: {temp_dir / 'output'}\n"
+        "num_images: 5\n"
+    )
+    
+    assert peek_config(config_path) == {
+        "num_images": 5,
+        "train_test_val_split": [0.8, 0.1, 0.1],
+    }
+
+
+def test_peek_config_keys_beyond_max_lines(temp_dir, full_config):
+    """Test that keys past the parsed header are read from the full file."""
+    config_path = temp_dir / "config.yaml"
+    save_config(full_config, config_path)
+    
+    assert peek_config(config_path, max_lines=3) == {
+        "num_images": 7,
+        "train_test_val_split": [0.6, 0.2, 0.2],
+    }
+
+
+def test_peek_config_json(temp_dir, full_config):
+    """Test that JSON configs are peeked through the full loader."""
+    config_path = temp_dir / "config.json"
+    save_config(full_config, config_path)
+    
+    assert peek_config(config_path, keys=("num_images", "random_seed")) == {
+        "num_images": 7,
+        "random_seed": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "model_dir: \"/models\nnum_images: 5\n"],
+    ids=["empty", "truncated"],
+)
+def test_peek_config_invalid_file(temp_dir, text):
+    """Test that empty and half-written files raise ValueError."""
+    config_path = temp_dir / "config.yaml"
+    config_path.write_text(text)
+    
+    with pytest.raises(ValueError):
+        peek_config(config_path)
@@ -3,6 +3,7 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock
 from nunalleq_synth.pipeline.generator import SyntheticGenerator
 
 
@@ -24,4 +25,42 @@ def test_split_counts(sample_config):
     assert train + test + val == sample_config.num_images
     assert train == 8  # 80% of 10
     assert test == 1   # 10% of 10
-    assert val == 1    # 10% of 10
\ No newline at end of file
+    assert val == 1    # 10% of 10
+
+
+def test_camera_pose_evaluated_before_bboxes(sample_config, mock_blender, temp_dir):
+    """Test that the view layer is updated between posing and bbox computation."""
+    generator = SyntheticGenerator(sample_config)
+    generator._draw_scene_params = MagicMock()
+    generator._ensure_scene = MagicMock()
+    generator._place_objects = MagicMock(return_value=[(MagicMock(), 0)])
+    generator.camera_randomizer = MagicMock()
+    generator.bbox_calculator = MagicMock()
+    generator.renderer = MagicMock()
+    
+    calls = []
+    generator.camera_randomizer.randomize_camera.side_effect = (
+        lambda *args: calls.append("pose")
+    )
+    mock_blender.context.view_layer.update.side_effect = (
+        lambda: calls.append("update")
+    )
+    generator.bbox_calculator.calculate_bboxes_batch.side_effect = (
+        lambda *args, **kwargs: calls.append("bboxes")
+    )
+    
+    try:
+        generator.generate_single_image(temp_dir / "a.jpg", temp_dir / "a.txt")
+    finally:
+        mock_blender.context.view_layer.update.side_effect = None
+    
+    assert calls[:3] == ["pose", "update", "bboxes"]
+
+
+def test_check_existing_dataset_ignores_empty_config(sample_config, mock_blender):
+    """Test that an empty config left by an interrupted run is ignored."""
+    generator = SyntheticGenerator(sample_config)
+    config_path = sample_config.output_dir / "config.yaml"
+    config_path.write_text("")
+    
+    generator._check_existing_dataset(config_path)
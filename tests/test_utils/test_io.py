@@ -0,0 +1,66 @@
+# ============================================================================
+# tests/test_utils/test_io.py
+# ============================================================================
+"""Tests for I/O utilities."""
+
+import shutil
+
+import numpy as np
+import pytest
+from nunalleq_synth.utils.io import (
+    count_files,
+    iter_files,
+    list_files,
+    list_files_cached,
+    save_image,
+)
+
+
+def test_save_image_recreates_removed_directory(temp_dir):
+    """Test that a save succeeds after its cached directory was removed."""
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+    output_dir = temp_dir / "images"
+    
+    assert save_image(image, output_dir / "a.png")
+    shutil.rmtree(output_dir)
+    
+    assert save_image(image, output_dir / "b.png")
+    assert (output_dir / "b.png").exists()
+
+
+@pytest.fixture
+def symlink_tree(temp_dir):
+    """Create a model tree with a directory symlink pointing back up."""
+    models = temp_dir / "models"
+    (models / "a").mkdir(parents=True)
+    (models / "a" / "x.glb").write_bytes(b"")
+    (models / "b.glb").write_bytes(b"")
+    (models / "a" / "loop").symlink_to("..", target_is_directory=True)
+    return models
+
+
+def test_list_files_does_not_follow_directory_symlinks(symlink_tree):
+    """Test that the recursive walk matches Path.rglob on a symlink loop."""
+    expected = sorted(symlink_tree.rglob("*.glb"))
+    
+    assert list_files(symlink_tree, "*.glb", recursive=True) == expected
+    assert len(expected) == 2
+
+
+def test_list_files_cached_does_not_follow_directory_symlinks(
+    symlink_tree, temp_dir
+):
+    """Test that cached listings hold no files reached through symlinks."""
+    cache_dir = temp_dir / "cache"
+    expected = sorted(symlink_tree.rglob("*.glb"))
+    
+    assert list_files_cached(symlink_tree, "*.glb", cache_dir=cache_dir) == expected
+    assert list_files_cached(symlink_tree, "*.glb", cache_dir=cache_dir) == expected
+
+
+def test_iter_files_does_not_follow_directory_symlinks(symlink_tree):
+    """Test that streamed listings and counts skip symlinked directories."""
+    expected = sorted(symlink_tree.rglob("*.glb"))
+    
+    assert sorted(iter_files(symlink_tree, "*.glb", recursive=True)) == expected
+    assert count_files(symlink_tree, "*.glb", recursive=True) == len(expected)